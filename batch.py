@@ -0,0 +1,114 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils import load_network
+from pso_algorithm import pso_net, PSO_PARAMS
+
+def collect_files(inputs):
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = sorted(glob.glob(os.path.join(item, "*.tsv")))
+        else:
+            matches = sorted(glob.glob(item)) or [item]
+        for path in matches:
+            if path not in files:
+                files.append(path)
+    return files
+
+def run_file(path, params, include_labels=False):
+    record = {"file": path, "params": params}
+    start_time = time.time()
+    try:
+        network, nodes = load_network(path, verbose=False)
+        loaded_time = time.time()
+        record["nodes"] = len(nodes)
+        record["edges"] = sum(len(neighbors) for neighbors in network.values()) // 2
+
+        # pso_net mencetak ringkasan ke stdout; jangan sampai tercampur dengan output JSON Lines
+        with contextlib.redirect_stdout(io.StringIO()):
+            labels, modularity, q_scores = pso_net(network, **params)
+
+        record["modularity"] = modularity
+        record["communities"] = len(set(labels.values()))
+        record["q_scores"] = q_scores
+        if include_labels:
+            record["labels"] = {str(node): community for node, community in labels.items()}
+        record["load_seconds"] = loaded_time - start_time
+        record["pso_seconds"] = time.time() - loaded_time
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["total_seconds"] = time.time() - start_time
+    return record
+
+def file_params(path, index, defaults, overrides):
+    params = dict(defaults)
+    if params.get("seed") is not None:
+        params["seed"] += index
+    for key in (path, os.path.basename(path), os.path.splitext(os.path.basename(path))[0]):
+        params.update(overrides.get(key, {}))
+    return {key: value for key, value in params.items() if key in PSO_PARAMS}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Jalankan PSO-Net untuk banyak file jaringan TSV secara paralel (tanpa UI)."
+    )
+    parser.add_argument("inputs", nargs="+", help="File TSV, direktori, atau pola glob")
+    parser.add_argument("-o", "--output", help="File JSON Lines hasil (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(), help="Jumlah proses worker")
+    parser.add_argument("--particles", type=int, default=30, help="Jumlah partikel")
+    parser.add_argument("--max-gen", type=int, default=100, help="Maksimum generasi")
+    parser.add_argument("--seed", type=int, help="Seed dasar; file ke-i memakai seed + i")
+    parser.add_argument("--lpa-fraction", type=float, default=0.0, help="Porsi partikel awal dari label propagation")
+    parser.add_argument("--refine-every", type=int, default=0, help="Refinement global best tiap k generasi")
+    parser.add_argument("--adaptive", choices=["shrink", "reinit"], help="Swarm adaptif saat keragaman turun")
+    parser.add_argument("--params", help="File JSON berisi parameter per file (kunci: path, nama file, atau nama tanpa ekstensi)")
+    parser.add_argument("--labels", action="store_true", help="Sertakan label komunitas per node pada output")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    files = collect_files(args.inputs)
+    defaults = {
+        "num_particles": args.particles,
+        "max_gen": args.max_gen,
+        "seed": args.seed,
+        "lpa_fraction": args.lpa_fraction,
+        "refine_every": args.refine_every,
+        "adaptive": args.adaptive,
+    }
+    overrides = {}
+    if args.params:
+        with open(args.params) as f:
+            overrides = json.load(f)
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    failures = 0
+    start_time = time.time()
+    try:
+        with ProcessPoolExecutor(max_workers=max(1, args.workers or 1)) as pool:
+            futures = [
+                pool.submit(run_file, path, file_params(path, i, defaults, overrides), args.labels)
+                for i, path in enumerate(files)
+            ]
+            for future in as_completed(futures):
+                record = future.result()
+                failures += "error" in record
+                output.write(json.dumps(record, default=str) + "\n")
+                output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"Selesai: {len(files)} file, {failures} gagal, {time.time() - start_time:.2f} detik", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
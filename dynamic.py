@@ -0,0 +1,222 @@
+import time
+from collections import defaultdict, deque
+import numpy as np
+from utils import build_csr, update_csr
+from pso_algorithm import pso_csr, decode_genes, labels_to_communities, labels_to_genes
+
+# Partisi terbaik dibukukan per komunitas (total derajat, jumlah kuadratnya, jumlah edge internal)
+# supaya Q bisa diperbarui per edge dan per perpindahan node tanpa menyentuh seluruh graf.
+# CSR dan swarm baru disinkronkan saat pass PSO global diminta.
+
+def track_partition(state, labels):
+    indptr, indices = state["indptr"], state["indices"]
+    degrees = np.diff(indptr)
+    sources = np.repeat(np.arange(len(degrees)), degrees)
+    labelled = labels >= 0
+    totals = np.bincount(labels[labelled], weights=degrees[labelled]).astype(np.int64).tolist()
+    state.update(
+        labels=labels.tolist(),
+        totals={label: total for label, total in enumerate(totals) if total},
+        squares=sum(total * total for total in totals),
+        internal=int(np.count_nonzero(labels[sources] == labels[indices])),
+        two_m=len(indices),
+        next_label=len(totals),
+        communities=labels_to_communities(labels, state["nodes"]),
+    )
+
+def tracked_modularity(state):
+    if state["two_m"] == 0:
+        return 0
+    return state["internal"] / state["two_m"] - state["squares"] / state["two_m"] ** 2
+
+def shift_total(state, label, delta):
+    total = state["totals"].get(label, 0)
+    state["squares"] += (total + delta) ** 2 - total ** 2
+    if total + delta:
+        state["totals"][label] = total + delta
+    else:
+        state["totals"].pop(label, None)
+
+def set_label(state, node, label):
+    state["labels"][node] = label
+    if label >= 0:
+        state["communities"][state["nodes"][node]] = label
+    else:
+        state["communities"].pop(state["nodes"][node], None)
+
+def start_dynamic(network, num_particles=30, max_gen=100, seed=None, **pso_options):
+    rng = np.random.default_rng(seed)
+    nodes, indptr, indices = build_csr(network)
+    globalbest, _, q_scores, swarm = pso_csr(
+        indptr, indices, num_particles, max_gen, rng, **pso_options
+    )
+
+    state = {
+        "network": network,
+        "nodes": nodes,
+        "index": {node: i for i, node in enumerate(nodes)},
+        "indptr": indptr,
+        "indices": indices,
+        "swarm": swarm,
+        "rng": rng,
+        "pso_options": pso_options,
+        # Pasangan node yang berubah sejak CSR dan swarm terakhir disinkronkan
+        "pending": set(),
+    }
+    track_partition(state, decode_genes(globalbest))
+    return state, state["communities"], tracked_modularity(state), q_scores
+
+def redraw_rows(genes, rows, node, indptr, indices, degrees, rng):
+    if len(rows) == 0:
+        return
+    if degrees[node] == 0:
+        genes[rows, node] = -1
+    else:
+        genes[rows, node] = indices[indptr[node] + rng.integers(0, degrees[node], size=len(rows))]
+
+def repair_genes(genes, indptr, indices, removed, redraw, rng):
+    # Gen yang menunjuk lewat link yang dihapus, serta node yang belum punya gen, diundi ulang
+    degrees = np.diff(indptr)
+    for a, b in removed:
+        for node, neighbor in ((a, b), (b, a)):
+            broken = np.flatnonzero(genes[:, node] == neighbor)
+            redraw_rows(genes, broken, node, indptr, indices, degrees, rng)
+
+    for node in redraw:
+        stale = np.flatnonzero(genes[:, node] < 0) if degrees[node] else np.arange(len(genes))
+        redraw_rows(genes, stale, node, indptr, indices, degrees, rng)
+    return genes
+
+def move_nodes(state, touched):
+    # Local move ΔQ yang dibatasi pada node tersentuh dan tetangga langsungnya, jadi biayanya
+    # sebanding dengan ukuran perubahan, bukan ukuran graf
+    network, nodes, index, labels = state["network"], state["nodes"], state["index"], state["labels"]
+    region = set(touched)
+    for node in touched:
+        region.update(index[neighbor] for neighbor in network[nodes[node]])
+    queued = set(touched)
+    queue = deque(touched)
+    moved = 0
+    while queue:
+        node = queue.popleft()
+        queued.discard(node)
+        neighbors = [index[neighbor] for neighbor in network[nodes[node]]]
+        k = len(neighbors)
+        if k == 0:
+            continue
+
+        links = defaultdict(int)
+        for neighbor in neighbors:
+            if neighbor != node:
+                links[labels[neighbor]] += 1
+
+        # ΔQ berpindah ke komunitas C sebanding dengan k_i,C - tot_C * k_i / 2m
+        current = labels[node]
+        shift_total(state, current, -k)
+        best = current
+        best_gain = links.get(current, 0) - state["totals"].get(current, 0) * k / state["two_m"]
+        for candidate, count in links.items():
+            gain = count - state["totals"].get(candidate, 0) * k / state["two_m"]
+            if gain > best_gain + 1e-12:
+                best, best_gain = candidate, gain
+        shift_total(state, best, k)
+
+        if best != current:
+            state["internal"] += 2 * (links.get(best, 0) - links.get(current, 0))
+            set_label(state, node, best)
+            moved += 1
+            for neighbor in neighbors:
+                if neighbor in region and neighbor not in queued and labels[neighbor] != best:
+                    queued.add(neighbor)
+                    queue.append(neighbor)
+    return moved
+
+def sync_swarm(state):
+    # Terapkan perubahan yang tertunda ke CSR dan swarm; biayanya linear terhadap graf,
+    # jadi hanya dijalankan sebelum pass PSO global
+    nodes, network, pending = state["nodes"], state["network"], state["pending"]
+    present = [(a, b) for a, b in pending if nodes[b] in network[nodes[a]]]
+    removed = [(a, b) for a, b in pending if nodes[b] not in network[nodes[a]]]
+    indptr, indices = update_csr(state["indptr"], state["indices"], len(nodes), present, removed)
+
+    swarm = state["swarm"]
+    swarm = np.hstack([swarm, np.full((len(swarm), len(nodes) - swarm.shape[1]), -1, dtype=np.int64)])
+    touched = sorted({node for pair in pending for node in pair})
+    state.update(indptr=indptr, indices=indices,
+                 swarm=repair_genes(swarm, indptr, indices, removed, touched, state["rng"]))
+    pending.clear()
+
+def reoptimize(state, max_gen=10):
+    # Pass PSO global dengan warm start: partisi saat ini menggantikan partikel pertama
+    sync_swarm(state)
+    indptr, indices, rng = state["indptr"], state["indices"], state["rng"]
+    initial_population = state["swarm"].copy()
+    initial_population[0] = labels_to_genes(indptr, indices, np.array(state["labels"], dtype=np.int64), rng)
+    globalbest, best_fitness, q_scores, swarm = pso_csr(
+        indptr, indices, len(initial_population), max_gen, rng,
+        initial_population=initial_population, **state["pso_options"]
+    )
+
+    state["swarm"] = swarm
+    if best_fitness > tracked_modularity(state):
+        track_partition(state, decode_genes(globalbest))
+    return state["communities"], tracked_modularity(state), q_scores
+
+def apply_edge_updates(state, added=(), removed=(), max_gen=0):
+    start_time = time.time()
+    network, nodes, index, labels = state["network"], state["nodes"], state["index"], state["labels"]
+    touched = set()
+
+    removed_count = 0
+    for a, b in removed:
+        if a in index and b in index and b in network[a]:
+            network[a].discard(b)
+            network[b].discard(a)
+            i, j = index[a], index[b]
+            entries = 1 if i == j else 2
+            if labels[i] == labels[j]:
+                state["internal"] -= entries
+            for node in (i, j)[:entries]:
+                shift_total(state, labels[node], -1)
+            state["two_m"] -= entries
+            for node in (i, j):
+                if not network[nodes[node]]:
+                    set_label(state, node, -1)
+            state["pending"].add((i, j))
+            touched.update((i, j))
+            removed_count += 1
+
+    added_count = 0
+    for a, b in added:
+        for node in (a, b):
+            if node not in index:
+                index[node] = len(nodes)
+                nodes.append(node)
+                labels.append(-1)
+        if b not in network.setdefault(a, set()):
+            network[a].add(b)
+            network.setdefault(b, set()).add(a)
+            i, j = index[a], index[b]
+            # Node baru atau yang sebelumnya terisolasi mulai sebagai komunitas sendiri
+            for node in (i, j):
+                if labels[node] < 0:
+                    set_label(state, node, state["next_label"])
+                    state["next_label"] += 1
+            entries = 1 if i == j else 2
+            if labels[i] == labels[j]:
+                state["internal"] += entries
+            for node in (i, j)[:entries]:
+                shift_total(state, labels[node], 1)
+            state["two_m"] += entries
+            state["pending"].add((i, j))
+            touched.update((i, j))
+            added_count += 1
+
+    moved = move_nodes(state, sorted(touched))
+    q_scores = []
+    if max_gen:
+        _, _, q_scores = reoptimize(state, max_gen)
+
+    print(f"\nUpdate: +{added_count} / -{removed_count} edge, {moved} node dipindah, "
+          f"{time.time() - start_time:.4f} seconds")
+    return state["communities"], tracked_modularity(state), q_scores
@@ -0,0 +1,94 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from utils import build_csr
+from pso_algorithm import pso_csr, decode_genes, csr_modularity, labels_to_communities
+from refinement import local_moving
+
+_graph = None
+
+def init_worker(indptr, indices):
+    global _graph
+    _graph = (indptr, indices)
+
+def run_restart(seed, pso_options):
+    indptr, indices = _graph
+    globalbest, fitness, _, _ = pso_csr(indptr, indices, rng=np.random.default_rng(seed), **pso_options)
+    return decode_genes(globalbest), fitness
+
+def co_assignment(indptr, indices, labels, agreement=None):
+    # Hanya dihitung untuk edge yang ada, jadi memori O(m) bukan O(n²)
+    sources = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    same = (labels[sources] == labels[indices]) & (labels[sources] >= 0)
+    if agreement is None:
+        agreement = np.zeros(len(indices))
+    agreement += same
+    return agreement
+
+def consensus_labels(indptr, indices, agreement, initial, rng, threshold=0.5):
+    n = len(indptr) - 1
+    weights = np.where(agreement >= threshold, agreement, 0.0)
+    # Mulai dari partisi restart terbaik; dari singleton local move macet di klaster kecil
+    labels = local_moving(indptr, indices, initial, rng, max_sweeps=50, weights=weights)
+
+    # Node yang semua edge-nya di bawah threshold ikut tetangga yang paling sering sekomunitas
+    sources = np.repeat(np.arange(n), np.diff(indptr))
+    strengths = np.bincount(sources, weights=weights, minlength=n)
+    for node in np.flatnonzero((strengths == 0) & (np.diff(indptr) > 0)).tolist():
+        row = slice(indptr[node], indptr[node + 1])
+        if agreement[row].max() > 0:
+            labels[node] = labels[indices[row][np.argmax(agreement[row])]]
+    return labels
+
+def node_stability(indptr, indices, agreement, labels):
+    n = len(indptr) - 1
+    degrees = np.diff(indptr)
+    sources = np.repeat(np.arange(n), degrees)
+    # Edge di dalam komunitas konsensus stabil jika sering sekomunitas, edge antar komunitas sebaliknya
+    consistent = np.where(labels[sources] == labels[indices], agreement, 1.0 - agreement)
+    totals = np.bincount(sources, weights=consistent, minlength=n)
+    return np.divide(totals, degrees, out=np.ones(n), where=degrees > 0)
+
+def ensemble_csr(indptr, indices, restarts=8, seed=None, workers=None, threshold=0.5, **pso_options):
+    if restarts < 1:
+        raise ValueError(f"Jumlah restart minimal 1, bukan {restarts}")
+    seeds = np.random.SeedSequence(seed).spawn(restarts + 1)
+    agreement = np.zeros(len(indices))
+    run_scores = []
+    best_labels, best_fitness = None, float("-inf")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(indptr, indices)) as pool:
+        futures = [pool.submit(run_restart, run_seed, pso_options) for run_seed in seeds[1:]]
+        # Diambil sesuai urutan submit supaya hasil tetap deterministik untuk seed yang sama
+        for future in futures:
+            labels, fitness = future.result()
+            co_assignment(indptr, indices, labels, agreement)
+            run_scores.append(fitness)
+            if fitness > best_fitness:
+                best_labels, best_fitness = labels, fitness
+
+    agreement /= restarts
+    labels = consensus_labels(
+        indptr, indices, agreement, best_labels, np.random.default_rng(seeds[0]), threshold
+    )
+    stability = node_stability(indptr, indices, agreement, labels)
+    return labels, stability, run_scores
+
+def ensemble_pso(network, restarts=8, seed=None, workers=None, threshold=0.5, **pso_options):
+    start_time = time.time()
+    nodes, indptr, indices = build_csr(network)
+
+    labels, stability, run_scores = ensemble_csr(
+        indptr, indices, restarts, seed, workers, threshold, **pso_options
+    )
+    modularity = csr_modularity(indptr, indices, labels)
+
+    print(f"\nExecution Time: {time.time() - start_time:.4f} seconds")
+    print(f"Modularity per restart: {', '.join(f'{q:.4f}' for q in sorted(run_scores))}")
+    print(f"Modularity konsensus: {modularity:.4f}")
+    print(f"Stabilitas rata-rata node: {stability.mean() if len(stability) else 0:.4f}")
+
+    communities = labels_to_communities(labels, nodes)
+    return communities, modularity, dict(zip(nodes, stability.tolist())), run_scores
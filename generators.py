@@ -0,0 +1,80 @@
+import numpy as np
+
+from utils import csr_from_edges
+
+# Semua generator bekerja langsung pada array edge lalu membangun CSR, tanpa dict-of-sets
+# dan tanpa iterasi pasangan node, sehingga bisa dipakai sampai jutaan node
+
+def power_law(rng, size, exponent, low, high):
+    # Sampling inverse-CDF dari distribusi power-law kontinu terpotong di [low, high]
+    u = rng.random(size)
+    a = 1.0 - exponent
+    return (low ** a + u * (high ** a - low ** a)) ** (1.0 / a)
+
+def pair_stubs(owners, groups, rng):
+    # Stub diacak lalu dipasangkan berurutan di dalam grup yang sama; sisa ganjil dibuang
+    order = rng.permutation(len(owners))
+    order = order[np.argsort(groups[order], kind="stable")]
+    owners, groups = owners[order], groups[order]
+    same = groups[:-1] == groups[1:]
+    first = np.ones(len(owners), dtype=bool)
+    first[1:] = ~same
+    rank = np.arange(len(owners)) - np.maximum.accumulate(np.where(first, np.arange(len(owners)), 0))
+    left = np.flatnonzero((rank % 2 == 0)[:-1] & same)
+    return owners[left], owners[left + 1]
+
+def erdos_renyi(n, avg_degree=10, seed=None):
+    # G(n, m) dengan m = n * avg_degree / 2 edge yang di-sampling langsung
+    rng = np.random.default_rng(seed)
+    m = int(round(n * avg_degree / 2))
+    return csr_from_edges(n, rng.integers(0, n, size=m), rng.integers(0, n, size=m))
+
+def power_law_graph(n, avg_degree=10, exponent=2.5, seed=None):
+    # Mendekati model Chung-Lu: jumlah stub per node ~ Poisson sebanding bobot power-law,
+    # lalu stub diacak dan dipasangkan (lebih cepat dari sampling ujung edge satu per satu)
+    rng = np.random.default_rng(seed)
+    weights = power_law(rng, n, exponent, 1.0, np.sqrt(n))
+    stubs = np.repeat(np.arange(n), rng.poisson(weights * (n * avg_degree / weights.sum())))
+    stubs = stubs[rng.permutation(len(stubs))]
+    half = len(stubs) // 2
+    return csr_from_edges(n, stubs[:half], stubs[half:2 * half])
+
+def planted_partition(n, avg_degree=10, mixing=0.2, degree_exponent=2.5, community_exponent=1.5,
+                      min_community=20, max_community=200, seed=None):
+    # Gaya LFR: ukuran komunitas dan derajat mengikuti power-law, porsi `mixing` edge antar komunitas
+    rng = np.random.default_rng(seed)
+
+    expected = (min_community + max_community) / 2
+    sizes = np.empty(0, dtype=np.int64)
+    while sizes.sum() < n:
+        batch = int(np.ceil((n - sizes.sum()) / expected)) + 1
+        sizes = np.concatenate([sizes, power_law(rng, batch, community_exponent, min_community, max_community).astype(np.int64)])
+    sizes = sizes[:np.searchsorted(np.cumsum(sizes), n) + 1]
+    sizes[-1] -= sizes.sum() - n
+    membership = rng.permutation(np.repeat(np.arange(len(sizes)), sizes))
+
+    # Derajat minimum dipilih supaya rata-rata derajat power-law mendekati avg_degree
+    min_degree = max(1.0, avg_degree * (degree_exponent - 2) / (degree_exponent - 1))
+    degrees = np.round(power_law(rng, n, degree_exponent, min_degree, max(min_degree, np.sqrt(n) * avg_degree)))
+    internal = np.minimum(np.round(degrees * (1 - mixing)), sizes[membership] - 1).astype(np.int64)
+    external = np.maximum(degrees.astype(np.int64) - internal, 0)
+
+    nodes = np.arange(n)
+    internal_owners = np.repeat(nodes, internal)
+    sources, targets = pair_stubs(internal_owners, membership[internal_owners], rng)
+    external_owners = np.repeat(nodes, external)
+    ext_sources, ext_targets = pair_stubs(external_owners, np.zeros(len(external_owners), dtype=np.int64), rng)
+    crossing = membership[ext_sources] != membership[ext_targets]
+
+    indptr, indices = csr_from_edges(
+        n,
+        np.concatenate([sources, ext_sources[crossing]]),
+        np.concatenate([targets, ext_targets[crossing]]),
+    )
+    return indptr, indices, membership
+
+GENERATORS = {
+    "er": erdos_renyi,
+    "planted": lambda n, avg_degree=10, seed=None: planted_partition(n, avg_degree, seed=seed)[:2],
+    "powerlaw": power_law_graph,
+}
@@ -0,0 +1,229 @@
+import os
+import importlib.util
+import warnings
+import numpy as np
+
+# ===== Implementasi referensi (Python murni / NumPy) =====
+
+def locus_chains_python(genes):
+    genes = genes.tolist()
+    labels = [-1] * len(genes)
+    order = []
+    cid = 0
+    for node in range(len(genes)):
+        if labels[node] >= 0 or genes[node] < 0:
+            continue
+        cid += 1
+        current = node
+        while True:
+            labels[current] = cid
+            order.append(current)
+            neighbor = genes[current]
+            if neighbor < 0 or labels[neighbor] >= 0:
+                break
+            current = neighbor
+    return np.array(labels, dtype=np.int64), np.array(order, dtype=np.int64)
+
+def merge_small_python(genes, labels, order, min_size=5):
+    genes = genes.tolist()
+    labels = labels.tolist()
+    order = order.tolist()
+
+    sizes = [0] * (max(labels, default=0) + 1)
+    for node in order:
+        sizes[labels[node]] += 1
+
+    merged = labels[:]
+    assigned = [label >= 0 and sizes[label] >= min_size for label in labels]
+    for node in order:
+        if sizes[labels[node]] >= min_size:
+            continue
+        neighbor = genes[node]
+        if assigned[neighbor]:
+            merged[node] = merged[neighbor]
+        assigned[node] = True
+    return np.array(merged, dtype=np.int64)
+
+def modularity_python(indptr, indices, labels, weights=None, loops=None):
+    degrees = np.diff(indptr)
+    sources = np.repeat(np.arange(len(degrees)), degrees)
+    same = labels[sources] == labels[indices]
+    if weights is None:
+        internal = float(np.count_nonzero(same))
+        strengths = degrees
+    else:
+        internal = float(weights[same].sum())
+        strengths = np.bincount(sources, weights=weights, minlength=len(degrees))
+
+    labelled = labels >= 0
+    squares = 0.0
+    if loops is not None:
+        # Node tanpa tetangga tapi punya self-loop tetap jadi komunitasnya sendiri
+        internal += float(loops.sum())
+        strengths = strengths + loops
+        squares = float(np.sum(strengths[~labelled] ** 2))
+
+    two_m = float(strengths.sum())
+    if two_m == 0:
+        return 0
+
+    totals = np.bincount(labels[labelled], weights=strengths[labelled])
+    squares += float(np.sum(totals ** 2))
+    return internal / two_m - squares / two_m ** 2
+
+# ===== Implementasi JIT (Numba), diimpor dan dikompilasi saat pertama kali dipanggil =====
+
+_jit_kernels = None
+
+def load_jit_kernels():
+    global _jit_kernels
+    if _jit_kernels is not None:
+        return _jit_kernels
+    import numba
+
+    @numba.njit(cache=True)
+    def locus_chains_jit(genes):
+        n = genes.shape[0]
+        labels = np.full(n, -1, dtype=np.int64)
+        order = np.empty(n, dtype=np.int64)
+        count = 0
+        cid = 0
+        for node in range(n):
+            if labels[node] >= 0 or genes[node] < 0:
+                continue
+            cid += 1
+            current = node
+            while True:
+                labels[current] = cid
+                order[count] = current
+                count += 1
+                neighbor = genes[current]
+                if neighbor < 0 or labels[neighbor] >= 0:
+                    break
+                current = neighbor
+        return labels, order[:count]
+
+    @numba.njit(cache=True)
+    def merge_small_jit(genes, labels, order, min_size):
+        n = labels.shape[0]
+        sizes = np.zeros(max(labels.max(), 0) + 1 if n else 1, dtype=np.int64)
+        for i in range(order.shape[0]):
+            sizes[labels[order[i]]] += 1
+
+        merged = labels.copy()
+        assigned = np.zeros(n, dtype=np.bool_)
+        for node in range(n):
+            assigned[node] = labels[node] >= 0 and sizes[labels[node]] >= min_size
+        for i in range(order.shape[0]):
+            node = order[i]
+            if sizes[labels[node]] >= min_size:
+                continue
+            neighbor = genes[node]
+            if assigned[neighbor]:
+                merged[node] = merged[neighbor]
+            assigned[node] = True
+        return merged
+
+    @numba.njit(cache=True)
+    def modularity_jit(indptr, indices, labels, weights, loops):
+        n = indptr.shape[0] - 1
+        weighted = weights.shape[0] > 0
+        has_loops = loops.shape[0] > 0
+        totals = np.zeros(max(labels.max(), 0) + 1 if n else 1)
+        internal = 0.0
+        two_m = 0.0
+        squares = 0.0
+        for node in range(n):
+            strength = 0.0
+            for e in range(indptr[node], indptr[node + 1]):
+                weight = weights[e] if weighted else 1.0
+                strength += weight
+                if labels[indices[e]] == labels[node]:
+                    internal += weight
+            if has_loops:
+                strength += loops[node]
+                internal += loops[node]
+            two_m += strength
+            if labels[node] >= 0:
+                totals[labels[node]] += strength
+            else:
+                squares += strength * strength
+
+        if two_m == 0:
+            return 0.0
+        for total in totals:
+            squares += total * total
+        return internal / two_m - squares / (two_m * two_m)
+
+    # Kompilasi dipaksa di sini (bukan saat panggilan pertama di tengah run) supaya kegagalan
+    # numba, misalnya ABI NumPy yang tidak cocok, bisa ditangkap di satu tempat
+    genes = np.array([1, 0], dtype=np.int64)
+    labels, order = locus_chains_jit(genes)
+    merged = merge_small_jit(genes, labels, order, 5)
+    empty = np.empty(0)
+    modularity_jit(np.array([0, 1, 2], dtype=np.int64), genes, merged, empty, empty)
+
+    _jit_kernels = (locus_chains_jit, merge_small_jit, modularity_jit)
+    return _jit_kernels
+
+_jit_error = None
+
+def jit_kernels():
+    global _jit_error
+    if _jit_error is None:
+        try:
+            return load_jit_kernels()
+        except Exception as e:
+            _jit_error = e
+    # Backend dipilih otomatis: numba yang gagal dimuat tidak boleh menghentikan run
+    if requested_backend != "auto":
+        raise RuntimeError(f"Backend numba gagal dimuat: {_jit_error}") from _jit_error
+    warnings.warn(f"Backend numba gagal dimuat ({_jit_error}); memakai kernel Python", RuntimeWarning)
+    use_backend("python")
+    return None
+
+def locus_chains_numba(genes):
+    jit = jit_kernels()
+    if jit is None:
+        return locus_chains_python(genes)
+    return jit[0](np.ascontiguousarray(genes, dtype=np.int64))
+
+def merge_small_numba(genes, labels, order, min_size=5):
+    jit = jit_kernels()
+    if jit is None:
+        return merge_small_python(genes, labels, order, min_size)
+    return jit[1](np.ascontiguousarray(genes, dtype=np.int64), labels, order, min_size)
+
+def modularity_numba(indptr, indices, labels, weights=None, loops=None):
+    jit = jit_kernels()
+    if jit is None:
+        return modularity_python(indptr, indices, labels, weights, loops)
+    empty = np.empty(0)
+    return jit[2](
+        indptr, indices, labels,
+        empty if weights is None else np.asarray(weights, dtype=np.float64),
+        empty if loops is None else np.asarray(loops, dtype=np.float64),
+    )
+
+BACKENDS = {
+    "python": (locus_chains_python, merge_small_python, modularity_python),
+}
+if importlib.util.find_spec("numba") is not None:
+    BACKENDS["numba"] = (locus_chains_numba, merge_small_numba, modularity_numba)
+
+locus_chains, merge_small, modularity = BACKENDS["python"]
+active_backend = "python"
+requested_backend = "python"
+
+def use_backend(name="auto"):
+    global locus_chains, merge_small, modularity, active_backend, requested_backend
+    requested_backend = name
+    if name == "auto":
+        name = "numba" if "numba" in BACKENDS else "python"
+    if name not in BACKENDS:
+        raise ValueError(f"Backend kernel tidak tersedia: {name} (pilihan: {', '.join(BACKENDS)})")
+    locus_chains, merge_small, modularity = BACKENDS[name]
+    active_backend = name
+    return name
+
+use_backend(os.environ.get("PSO_KERNEL_BACKEND", "auto"))
@@ -23,6 +23,12 @@ def main():
         uploaded_file = st.file_uploader("Upload file TSV", type=["tsv"])
         num_particles = st.slider("Jumlah Partikel", 0, 500, 300)
         maxgen = st.slider("Maksimum Generasi", 0, 200, 100)
+        lpa_fraction = st.slider("Porsi Partikel Awal dari Label Propagation", 0.0, 1.0, 0.0, step=0.05)
+        refine_every = st.slider("Refinement Global Best tiap k Generasi (0 = mati)", 0, 50, 0)
+        adaptive = st.selectbox(
+            "Swarm Adaptif (saat keragaman turun)", ["mati", "shrink", "reinit"],
+            help="shrink: kurangi partikel yang kembar; reinit: acak ulang partikel yang kembar"
+        )
         run_button = st.button("🚀 Jalankan Algoritma PSO")
 
     if uploaded_file is not None:
@@ -45,6 +51,9 @@ def main():
                     network,
                     num_particles=num_particles,
                     max_gen=maxgen,
+                    lpa_fraction=lpa_fraction,
+                    refine_every=refine_every,
+                    adaptive=None if adaptive == "mati" else adaptive,
                     update_callback=update_visualization
                 )
 
@@ -2,18 +2,161 @@ import random
 from collections import defaultdict, deque
 import numpy as np
 import time
+from utils import build_csr
+from refinement import local_moving
+import kernels
 
-def initialize_population(network, num_particles):
-    population = []
-    nodes = list(network.keys())
-    for _ in range(num_particles):
-        particle = {}
-        for node in nodes:
-            neighbors = list(network[node])
-            if neighbors:
-                particle[node] = random.choice(neighbors)
-        population.append(particle)
-    return population
+def label_propagation(indptr, indices, rng, max_iter=20, tolerance=1e-3):
+    n = len(indptr) - 1
+    degrees = np.diff(indptr)
+    sources = np.repeat(np.arange(n), degrees)
+    labels = np.arange(n)
+    if len(indices) == 0:
+        return labels
+
+    for _ in range(max_iter):
+        # Hitung frekuensi label tetangga per node lewat sort + panjang run (np.unique dan lexsort
+        # jauh lebih lambat), ambil yang terbanyak; seri diacak dengan tambahan acak di bawah 1
+        keys = sources * n + labels[indices]
+        keys.sort()
+        starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+        pairs = keys[starts]
+        counts = np.diff(np.append(starts, len(keys)))
+        owners = pairs // n
+        score = counts + 0.5 * rng.random(len(pairs))
+        groups = np.flatnonzero(np.concatenate([[True], owners[1:] != owners[:-1]]))
+        best = np.repeat(np.maximum.reduceat(score, groups), np.diff(np.append(groups, len(pairs))))
+        winners = np.flatnonzero(score == best)
+        winners = winners[np.concatenate([[True], owners[winners[1:]] != owners[winners[:-1]]])]
+
+        # Berhenti jika label (hampir) setiap node sudah termasuk yang terbanyak di antara tetangganya;
+        # membandingkan pemenang acak tidak pernah stabil karena seri selalu diundi ulang, dan pada
+        # graf besar selalu ada segelintir node perbatasan yang berosilasi
+        current = np.zeros(n, dtype=np.int64)
+        held = pairs % n == labels[owners]
+        current[owners[held]] = counts[held]
+        unstable = current[owners[winners]] < counts[winners]
+        if np.count_nonzero(unstable) <= tolerance * n:
+            break
+
+        proposed = labels.copy()
+        proposed[owners[winners[unstable]]] = pairs[winners[unstable]] % n
+
+        # Update sebagian node saja agar tidak berosilasi seperti LPA sinkron
+        active = rng.random(n) < 0.5
+        labels = np.where(active, proposed, labels)
+
+    return labels
+
+def labels_to_genes(indptr, indices, labels, rng):
+    # Simulasikan decode_genes sambil memilih gen: node hanya ikut label komunitas
+    # utamanya jika menunjuk node yang sudah dikunjungi dan sudah ikut label itu
+    n = len(indptr) - 1
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    labels = labels.tolist()
+    keys = rng.random(len(indices)).tolist()
+
+    genes = [-1] * n
+    visited = [False] * n
+    resolved = [-1] * n
+    main_chain = {}
+    chains = 0
+
+    def pick(node, accept):
+        best, best_key = -1, -1.0
+        for e in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[e]
+            if neighbor != node and keys[e] > best_key and accept(neighbor):
+                best, best_key = neighbor, keys[e]
+        return best
+
+    for node in range(n):
+        if visited[node] or indptr[node] == indptr[node + 1]:
+            continue
+        community = labels[node]
+        main = main_chain.get(community, -1)
+
+        def joins_main(u):
+            return labels[u] == community and visited[u] and resolved[u] == main
+
+        def unvisited(u):
+            return labels[u] == community and not visited[u]
+
+        target = pick(node, joins_main) if main >= 0 else -1
+        if target >= 0:
+            genes[node] = target
+            visited[node] = True
+            resolved[node] = main
+            continue
+
+        if pick(node, lambda u: labels[u] == community) < 0:
+            target = pick(node, lambda u: visited[u])
+            if target < 0:
+                target = pick(node, lambda u: True)
+            genes[node] = target if target >= 0 else node
+            visited[node] = True
+            continue
+
+        # Rantai baru. Rantai pertama sebuah komunitas menjadi label utamanya; rantai
+        # berikutnya diarahkan secepatnya kembali ke label utama
+        chains += 1
+        if main < 0:
+            main = main_chain[community] = chains
+        previous, current = -1, node
+        while True:
+            visited[current] = True
+            resolved[current] = chains
+            if current != node and chains != main:
+                target = pick(current, joins_main)
+                if target >= 0:
+                    genes[current] = target
+                    resolved[current] = main
+                    break
+
+            following = -1
+            if chains != main:
+                following = pick(current, lambda u: unvisited(u) and pick(u, joins_main) >= 0)
+            if following < 0:
+                following = pick(current, unvisited)
+            if following < 0:
+                genes[current] = previous if previous >= 0 else pick(current, lambda u: labels[u] == community)
+                break
+            genes[current] = following
+            previous, current = current, following
+
+    return np.array(genes, dtype=np.int64)
+
+def initialize_genes(indptr, indices, num_particles, rng, lpa_fraction=0.0):
+    degrees = np.diff(indptr)
+    has_neighbors = degrees > 0
+    genes = np.full((num_particles, len(degrees)), -1, dtype=np.int64)
+    if not has_neighbors.any():
+        return genes
+
+    starts = indptr[:-1][has_neighbors]
+    offsets = rng.integers(0, degrees[has_neighbors], size=(num_particles, len(starts)))
+    genes[:, has_neighbors] = indices[starts + offsets]
+
+    num_seeded = min(num_particles, int(round(num_particles * lpa_fraction)))
+    if num_seeded:
+        # LPA dijalankan sekali saja; partikel seeded lainnya salinan encoding-nya dengan 1% gen
+        # diacak ulang, jadi biaya seeding tidak bertambah dengan jumlah partikel
+        labels = label_propagation(indptr, indices, rng)
+        genes[0] = labels_to_genes(indptr, indices, labels, rng)
+        genes[1:num_seeded] = mutate_population(
+            np.repeat(genes[:1], num_seeded - 1, axis=0), indptr, indices, rng, max(1, len(degrees) // 100)
+        )
+    return genes
+
+def genes_to_particle(genes, nodes):
+    return {nodes[i]: nodes[g] for i, g in enumerate(genes.tolist()) if g >= 0}
+
+def initialize_population(network, num_particles, seed=None, lpa_fraction=0.0):
+    nodes, indptr, indices = build_csr(network)
+    rng = np.random.default_rng(seed)
+    genes = initialize_genes(indptr, indices, num_particles, rng, lpa_fraction)
+    return [genes_to_particle(row, nodes) for row in genes]
 
 def decode_particle(particle):
     communities = defaultdict(set)
@@ -54,6 +197,13 @@ def decode_particle(particle):
 
     return comm_map
 
+def decode_genes(genes):
+    labels, order = kernels.locus_chains(genes)
+    return kernels.merge_small(genes, labels, order)
+
+def labels_to_communities(labels, nodes):
+    return {nodes[i]: label for i, label in enumerate(labels.tolist()) if label >= 0}
+
 def calculate_modularity(network, labels):
     m = sum(len(neigh) for neigh in network.values()) / 2
     if m == 0:
@@ -78,6 +228,14 @@ def calculate_modularity(network, labels):
 
     return Q
 
+def csr_modularity(indptr, indices, labels, weights=None, loops=None):
+    return kernels.modularity(indptr, indices, labels, weights, loops)
+
+def population_fitness(genes, indptr, indices, weights=None, loops=None):
+    return np.array([
+        csr_modularity(indptr, indices, decode_genes(row), weights, loops) for row in genes
+    ])
+
 def crossover(parent1, parent2):
     keys = list(parent1.keys())
     i, j = sorted(random.sample(range(len(keys)), 2))
@@ -100,12 +258,77 @@ def mutate(particle, network):
         new_particle[node] = random.choice(neighbors)
     return new_particle
 
-def pso_net(network, num_particles=30, max_gen=100, update_callback=None):
-    start_time = time.time()
+def crossover_population(parents1, parents2, rng, rate=1.0):
+    num_particles, n = parents1.shape
+    if n < 2:
+        return parents1.copy(), np.broadcast_to(parents2, parents1.shape).copy()
+
+    first = rng.integers(0, n, size=num_particles)
+    second = rng.integers(0, n - 1, size=num_particles)
+    second += second >= first
+    low = np.minimum(first, second)[:, None]
+    high = np.maximum(first, second)[:, None]
+
+    columns = np.arange(n)
+    swap = (columns >= low) & (columns < high)
+    if rate < 1.0:
+        swap &= (rng.random(num_particles) < rate)[:, None]
+    return np.where(swap, parents2, parents1), np.where(swap, parents1, parents2)
+
+def mutate_population(genes, indptr, indices, rng, count=1):
+    degrees = np.diff(indptr)
+    candidates = np.flatnonzero(degrees > 0)
+    if len(candidates) == 0:
+        return genes
+
+    rows = np.repeat(np.arange(len(genes)), count)
+    columns = candidates[rng.integers(0, len(candidates), size=len(rows))]
+    genes[rows, columns] = indices[indptr[columns] + rng.integers(0, degrees[columns])]
+    return genes
+
+def population_diversity(genes, globalbest):
+    distances = np.count_nonzero(genes != globalbest, axis=1) / max(genes.shape[1], 1)
+    _, first = np.unique(genes, axis=0, return_index=True)
+    duplicate = np.ones(len(genes), dtype=bool)
+    duplicate[first] = False
+    stats = {
+        "active": len(genes),
+        "mean_hamming": float(distances.mean()) if len(genes) else 0.0,
+        "min_hamming": float(distances.min()) if len(genes) else 0.0,
+        "duplicates": int(np.count_nonzero(duplicate)),
+        "converged": int(np.count_nonzero(distances == 0)),
+    }
+    return stats, distances, duplicate
+
+def refine_particle(indptr, indices, genes, fitness, rng, time_limit=None, weights=None, loops=None):
+    labels = local_moving(
+        indptr, indices, decode_genes(genes), rng, time_limit=time_limit, weights=weights, loops=loops
+    )
+    refined = labels_to_genes(indptr, indices, labels, rng)
+    refined_fitness = csr_modularity(indptr, indices, decode_genes(refined), weights, loops)
+    if refined_fitness > fitness:
+        return refined, refined_fitness
+    return genes, fitness
 
-    population = initialize_population(network, num_particles) 
-    clusterings = [decode_particle(p) for p in population]
-    fitness = [calculate_modularity(network, c) for c in clusterings]
+def pso_csr(indptr, indices, num_particles=30, max_gen=100, rng=None, weights=None, loops=None,
+            lpa_fraction=0.0, refine_every=0, refine_time=None, generation_callback=None,
+            initial_population=None, mutation_count=1, crossover_rate=1.0, adaptive=None,
+            diversity_threshold=0.0, min_particles=None, diversity_callback=None, time_limit=None,
+            initial_fitness=None):
+    if adaptive not in (None, "shrink", "reinit"):
+        raise ValueError(f"Mode adaptif tidak dikenal: {adaptive} (pilihan: shrink, reinit)")
+    rng = rng if rng is not None else np.random.default_rng()
+
+    if initial_population is not None:
+        population = initial_population.copy()
+        num_particles = len(population)
+    else:
+        population = initialize_genes(indptr, indices, num_particles, rng, lpa_fraction)
+    # Pemanggil yang sudah menilai populasi awal bisa meneruskan fitness-nya
+    if initial_fitness is not None:
+        fitness = np.array(initial_fitness, dtype=float)
+    else:
+        fitness = population_fitness(population, indptr, indices, weights, loops)
 
     personalbest = population.copy()
     personalbest_fitness = fitness.copy()
@@ -115,41 +338,105 @@ def pso_net(network, num_particles=30, max_gen=100, update_callback=None):
     globalbest_fitness = personalbest_fitness[gbest_idx]
 
     q_scores = []
+    deadline = time.time() + time_limit if time_limit is not None else None
 
     for gen in range(max_gen):
-        for i in range(num_particles):
-            child1, child2 = crossover(population[i], personalbest[i])
-            mod1 = calculate_modularity(network, decode_particle(child1))
-            mod2 = calculate_modularity(network, decode_particle(child2))
-            temp_particle = child1 if mod1 > mod2 else child2
-
-            child1, child2 = crossover(temp_particle, globalbest)
-            mod1 = calculate_modularity(network, decode_particle(child1))
-            mod2 = calculate_modularity(network, decode_particle(child2))
-            temp_particle = child1 if mod1 > mod2 else child2
+        gen_start = time.time()
+        if deadline is not None and gen > 0 and gen_start > deadline:
+            break
+        child1, child2 = crossover_population(population, personalbest, rng, crossover_rate)
+        mod1 = population_fitness(child1, indptr, indices, weights, loops)
+        mod2 = population_fitness(child2, indptr, indices, weights, loops)
+        temp_population = np.where((mod1 > mod2)[:, None], child1, child2)
 
-            temp_particle = mutate(temp_particle, network)
+        child1, child2 = crossover_population(temp_population, globalbest, rng, crossover_rate)
+        mod1 = population_fitness(child1, indptr, indices, weights, loops)
+        mod2 = population_fitness(child2, indptr, indices, weights, loops)
+        temp_population = np.where((mod1 > mod2)[:, None], child1, child2)
 
-            decoded = decode_particle(temp_particle)
-            modularity = calculate_modularity(network, decoded)
-            population[i] = temp_particle
-            fitness[i] = modularity
+        population = mutate_population(temp_population, indptr, indices, rng, mutation_count)
+        fitness = population_fitness(population, indptr, indices, weights, loops)
 
-            if modularity > personalbest_fitness[i]:
-                personalbest[i] = temp_particle
-                personalbest_fitness[i] = modularity
+        improved = fitness > personalbest_fitness
+        personalbest[improved] = population[improved]
+        personalbest_fitness[improved] = fitness[improved]
 
         best_idx = np.argmax(personalbest_fitness)
         if personalbest_fitness[best_idx] > globalbest_fitness:
-            globalbest = personalbest[best_idx]
+            globalbest = personalbest[best_idx].copy()
             globalbest_fitness = personalbest_fitness[best_idx]
 
-        current_modularity = calculate_modularity(network, decode_particle(globalbest))
-        q_scores.append(current_modularity)
+        # Memetic: perbaiki global best dengan local move ΔQ, dibatasi waktu satu generasi
+        if refine_every and ((gen + 1) % refine_every == 0 or gen == max_gen - 1):
+            refine_limit = refine_time if refine_time is not None else time.time() - gen_start
+            globalbest, refined_fitness = refine_particle(
+                indptr, indices, globalbest, globalbest_fitness, rng, refine_limit, weights, loops
+            )
+            if refined_fitness > globalbest_fitness:
+                globalbest_fitness = refined_fitness
+                personalbest[best_idx] = globalbest
+                personalbest_fitness[best_idx] = globalbest_fitness
+
+        if adaptive or diversity_callback:
+            stats, distances, duplicate = population_diversity(population, globalbest)
+            if adaptive:
+                # Partikel yang sudah menempel ke global best atau kembar dengan partikel lain
+                # hanya menghasilkan anak yang sama; pemilik global best selalu dipertahankan
+                redundant = duplicate | (distances <= diversity_threshold)
+                redundant[best_idx] = False
+                redundant = np.flatnonzero(redundant)
+                if adaptive == "shrink":
+                    floor = min_particles if min_particles is not None else max(2, num_particles // 4)
+                    # Dikurangi bertahap, paling banyak 10% swarm per generasi
+                    redundant = redundant[:min(max(0, len(population) - floor), max(1, len(population) // 10))]
+                    keep = np.setdiff1d(np.arange(len(population)), redundant)
+                    population = population[keep]
+                    personalbest = personalbest[keep]
+                    personalbest_fitness = personalbest_fitness[keep]
+                elif len(redundant):
+                    # Acak ulang 5% gen dari global best; partikel acak penuh jarang bisa menyusul
+                    fresh = mutate_population(
+                        np.repeat(globalbest[None], len(redundant), axis=0), indptr, indices, rng,
+                        max(1, (len(indptr) - 1) // 20)
+                    )
+                    population[redundant] = fresh
+                    personalbest[redundant] = fresh
+                    personalbest_fitness[redundant] = population_fitness(fresh, indptr, indices, weights, loops)
+                stats["redundant"] = len(redundant)
+                stats["active"] = len(population)
+            if diversity_callback:
+                diversity_callback(stats, gen + 1)
+
+        q_scores.append(float(globalbest_fitness))
+
+        if generation_callback:
+            generation_callback(globalbest, q_scores, gen + 1)
+
+    return globalbest, float(globalbest_fitness), q_scores, personalbest
+
+# Keyword pso_net yang boleh diisi dari luar (batch.py, service.py); callback sengaja tidak termasuk
+PSO_PARAMS = ("num_particles", "max_gen", "seed", "lpa_fraction", "refine_every", "refine_time",
+              "mutation_count", "crossover_rate", "adaptive", "diversity_threshold",
+              "time_limit")
+
+def pso_net(network, num_particles=30, max_gen=100, update_callback=None, seed=None,
+            lpa_fraction=0.0, refine_every=0, refine_time=None, mutation_count=1, crossover_rate=1.0,
+            adaptive=None, diversity_threshold=0.0, diversity_callback=None, time_limit=None):
+    start_time = time.time()
+
+    nodes, indptr, indices = build_csr(network)
+
+    def generation_callback(globalbest, q_scores, gen):
+        decoded = labels_to_communities(decode_genes(globalbest), nodes)
+        update_callback(decoded, q_scores, q_scores, network, gen)
 
-        if update_callback:
-            decoded = decode_particle(globalbest)
-            update_callback(decoded, q_scores, q_scores, network, gen + 1)
+    globalbest, globalbest_fitness, q_scores, _ = pso_csr(
+        indptr, indices, num_particles, max_gen, np.random.default_rng(seed),
+        lpa_fraction=lpa_fraction, refine_every=refine_every, refine_time=refine_time,
+        mutation_count=mutation_count, crossover_rate=crossover_rate, adaptive=adaptive,
+        diversity_threshold=diversity_threshold, diversity_callback=diversity_callback,
+        time_limit=time_limit, generation_callback=generation_callback if update_callback else None
+    )
 
     end_time = time.time()
     print(f"\nExecution Time: {end_time - start_time:.4f} seconds")
@@ -158,5 +445,5 @@ def pso_net(network, num_particles=30, max_gen=100, update_callback=None):
     print(f"Modularity akhir: {q_scores[-1]:.4f}")
     print(f"Δ Modularity (Q akhir - Q awal): {delta_q:.4f}")
 
-    best_communities = decode_particle(globalbest)
+    best_communities = labels_to_communities(decode_genes(globalbest), nodes)
     return best_communities, globalbest_fitness, q_scores
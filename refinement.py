@@ -0,0 +1,64 @@
+import time
+from collections import defaultdict
+import numpy as np
+
+def local_moving(indptr, indices, labels, rng, time_limit=None, max_sweeps=10, weights=None, loops=None):
+    deadline = time.time() + time_limit if time_limit is not None else None
+    n = len(indptr) - 1
+    degrees = np.diff(indptr)
+    sources = np.repeat(np.arange(n), degrees)
+    if weights is None:
+        weights = np.ones(len(indices))
+    strengths = np.bincount(sources, weights=weights, minlength=n)
+    if loops is not None:
+        strengths = strengths + loops
+    two_m = float(strengths.sum())
+    if two_m == 0:
+        return labels.copy()
+
+    # Label dipadatkan ke 0..k-1 supaya total derajat komunitas muat di list
+    labelled = labels >= 0
+    compact = np.full(n, -1, dtype=np.int64)
+    compact[labelled] = np.unique(labels[labelled], return_inverse=True)[1]
+
+    totals = np.bincount(compact[labelled], weights=strengths[labelled], minlength=n).tolist()
+    strengths = strengths.tolist()
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    weights = weights.tolist()
+    community = compact.tolist()
+
+    for _ in range(max_sweeps):
+        moved = 0
+        for step, node in enumerate(rng.permutation(n).tolist()):
+            if deadline is not None and step % 256 == 0 and time.time() > deadline:
+                return np.array(community, dtype=np.int64)
+            k = strengths[node]
+            if k == 0 or community[node] < 0:
+                continue
+
+            links = defaultdict(float)
+            for e in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[e]
+                if neighbor != node:
+                    links[community[neighbor]] += weights[e]
+
+            # ΔQ berpindah ke komunitas C sebanding dengan k_i,C - tot_C * k_i / 2m
+            current = community[node]
+            totals[current] -= k
+            best = current
+            best_gain = links.get(current, 0) - totals[current] * k / two_m
+            for candidate, weight in links.items():
+                gain = weight - totals[candidate] * k / two_m
+                if gain > best_gain:
+                    best, best_gain = candidate, gain
+            totals[best] += k
+
+            if best != current:
+                community[node] = best
+                moved += 1
+
+        if moved == 0:
+            break
+
+    return np.array(community, dtype=np.int64)
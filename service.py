@@ -0,0 +1,250 @@
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from utils import load_network, network_from_edges
+from pso_algorithm import pso_net, PSO_PARAMS
+
+MAX_BODY_BYTES = 256 * 1024 * 1024
+MAX_FINISHED_JOBS = 1000
+
+def run_job(graph, params):
+    start_time = time.time()
+    if "path" in graph:
+        network, _ = load_network(graph["path"], verbose=False)
+    else:
+        network = network_from_edges(graph["edges"])
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        labels, modularity, q_scores = pso_net(network, **params)
+
+    return {
+        "modularity": modularity,
+        "communities": len(set(labels.values())),
+        "labels": {str(node): community for node, community in labels.items()},
+        "q_scores": q_scores,
+        "seconds": time.time() - start_time,
+    }
+
+def graph_hash(graph):
+    digest = hashlib.sha256()
+    if "path" in graph:
+        with open(graph["path"], "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    else:
+        # Urutan edge dan arah edge tidak mengubah graf, jadi tidak boleh mengubah kunci cache
+        edges = sorted(tuple(sorted((str(a), str(b)))) for a, b in graph["edges"])
+        digest.update(json.dumps(edges).encode())
+    return digest.hexdigest()
+
+def cache_key(graph_digest, params):
+    return graph_digest + ":" + json.dumps(params, sort_keys=True)
+
+def create_service(workers=None, queue_size=100, cache_size=256, data_dir=None):
+    workers = max(1, workers or os.cpu_count() or 1)
+    return {
+        # Worker dibuat dengan spawn, bukan fork: worker yang di-fork di tengah request ikut mewarisi
+        # socket klien dan socket server, sehingga klien yang membaca sampai EOF menggantung
+        "pool": ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")),
+        "workers": workers,
+        "queue": asyncio.Queue(maxsize=queue_size),
+        "jobs": OrderedDict(),
+        "cache": OrderedDict(),
+        "cache_size": cache_size,
+        "data_dir": os.path.realpath(data_dir) if data_dir else None,
+    }
+
+def resolve_data_path(service, path):
+    # Input "path" hanya boleh menunjuk file di dalam direktori data yang dikonfigurasi
+    root = service["data_dir"]
+    if root is None or not isinstance(path, str):
+        return None
+    full = os.path.realpath(os.path.join(root, path))
+    return full if os.path.commonpath([root, full]) == root else None
+
+def cache_put(service, key, result):
+    service["cache"][key] = result
+    service["cache"].move_to_end(key)
+    while len(service["cache"]) > service["cache_size"]:
+        service["cache"].popitem(last=False)
+
+def prune_jobs(service):
+    finished = [job_id for job_id, job in service["jobs"].items() if job["status"] in ("done", "failed", "cancelled")]
+    for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+        del service["jobs"][job_id]
+
+async def dispatcher(service):
+    loop = asyncio.get_running_loop()
+    while True:
+        job_id = await service["queue"].get()
+        job = service["jobs"].get(job_id)
+        if job is None or job["status"] == "cancelled":
+            service["queue"].task_done()
+            continue
+
+        job["status"] = "running"
+        job["started"] = time.time()
+        try:
+            result = await loop.run_in_executor(service["pool"], run_job, job.pop("graph"), job["params"])
+            if job["status"] != "cancelled":
+                cache_put(service, job["cache_key"], result)
+                job["status"] = "done"
+                job["result"] = result
+        except Exception as e:
+            if job["status"] != "cancelled":
+                job["status"] = "failed"
+                job["error"] = f"{type(e).__name__}: {e}"
+        job["finished"] = time.time()
+        prune_jobs(service)
+        service["queue"].task_done()
+
+def job_view(job_id, job, include_result=True):
+    view = {key: value for key, value in job.items() if key not in ("graph", "cache_key", "result")}
+    view["job_id"] = job_id
+    if include_result and "result" in job:
+        view["result"] = job["result"]
+    return view
+
+async def submit_job(service, payload):
+    if not isinstance(payload, dict):
+        return 400, {"error": "Body harus berupa objek JSON"}
+    if "edges" in payload:
+        graph = {"edges": payload["edges"]}
+    elif "path" in payload:
+        if service["data_dir"] is None:
+            return 403, {"error": "Input 'path' tidak aktif; jalankan service dengan --data-dir"}
+        path = resolve_data_path(service, payload["path"])
+        if path is None:
+            return 403, {"error": "Path harus berada di dalam direktori data"}
+        graph = {"path": path}
+    else:
+        return 400, {"error": "Body harus berisi 'edges' atau 'path'"}
+    params = {key: payload[key] for key in PSO_PARAMS if key in payload}
+
+    try:
+        digest = await asyncio.to_thread(graph_hash, graph)
+    except (OSError, TypeError, ValueError) as e:
+        return 400, {"error": f"Graf tidak valid: {e}"}
+    key = cache_key(digest, params)
+
+    job_id = uuid.uuid4().hex
+    job = {"status": "queued", "params": params, "submitted": time.time(), "cache_key": key, "graph": graph}
+    if key in service["cache"]:
+        service["cache"].move_to_end(key)
+        job.update(status="done", cached=True, result=service["cache"][key], finished=job["submitted"])
+        del job["graph"]
+        service["jobs"][job_id] = job
+        return 200, job_view(job_id, job)
+
+    try:
+        service["queue"].put_nowait(job_id)
+    except asyncio.QueueFull:
+        return 503, {"error": "Antrian penuh, coba lagi nanti"}
+    service["jobs"][job_id] = job
+    return 202, job_view(job_id, job)
+
+async def route(service, method, path, payload):
+    parts = [part for part in path.split("?")[0].split("/") if part]
+    if method == "GET" and parts == ["health"]:
+        return 200, {
+            "status": "ok",
+            "queued": service["queue"].qsize(),
+            "jobs": len(service["jobs"]),
+            "cached_results": len(service["cache"]),
+        }
+    if method == "POST" and parts == ["jobs"]:
+        return await submit_job(service, payload)
+    if len(parts) == 2 and parts[0] == "jobs":
+        job = service["jobs"].get(parts[1])
+        if job is None:
+            return 404, {"error": "Job tidak ditemukan"}
+        if method == "GET":
+            return 200, job_view(parts[1], job)
+        if method == "DELETE":
+            # Job yang sedang berjalan tidak bisa dihentikan di tengah proses worker;
+            # hasilnya dibuang begitu selesai
+            if job["status"] in ("queued", "running"):
+                job["status"] = "cancelled"
+                job.pop("graph", None)
+            return 200, job_view(parts[1], job, include_result=False)
+    return 404, {"error": "Endpoint tidak ditemukan"}
+
+async def handle_connection(service, reader, writer):
+    status, body = 400, {"error": "Request tidak valid"}
+    try:
+        request_line = (await reader.readline()).decode("latin-1").split()
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0))
+        if len(request_line) >= 2 and length <= MAX_BODY_BYTES:
+            payload = json.loads(await reader.readexactly(length)) if length else {}
+            status, body = await route(service, request_line[0].upper(), request_line[1], payload)
+        elif length > MAX_BODY_BYTES:
+            status, body = 413, {"error": "Body terlalu besar"}
+    except (ValueError, TypeError, asyncio.IncompleteReadError) as e:
+        status, body = 400, {"error": f"Request tidak valid: {e}"}
+
+    data = json.dumps(body, default=str).encode()
+    reason = {200: "OK", 202: "Accepted", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+              413: "Payload Too Large", 503: "Service Unavailable"}.get(status, "OK")
+    writer.write(
+        f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data
+    )
+    with contextlib.suppress(ConnectionError):
+        await writer.drain()
+    writer.close()
+
+async def serve(host="127.0.0.1", port=8765, workers=None, queue_size=100, cache_size=256, ready=None,
+                data_dir=None):
+    service = create_service(workers, queue_size, cache_size, data_dir)
+    dispatchers = [
+        asyncio.create_task(dispatcher(service))
+        for _ in range(service["workers"])
+    ]
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(service, reader, writer), host, port
+    )
+    if ready is not None:
+        ready(server.sockets[0].getsockname()[1])
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for task in dispatchers:
+            task.cancel()
+        service["pool"].shutdown(cancel_futures=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan HTTP lokal untuk deteksi komunitas PSO-Net.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-w", "--workers", type=int, help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument("--queue-size", type=int, default=100, help="Kapasitas antrian job")
+    parser.add_argument("--cache-size", type=int, default=256, help="Jumlah hasil yang disimpan di cache")
+    parser.add_argument("--data-dir", help="Direktori file TSV yang boleh dipakai lewat input 'path' (default: tidak aktif)")
+    args = parser.parse_args(argv)
+
+    print(f"PSO-Net service berjalan di http://{args.host}:{args.port}")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, args.workers, args.queue_size, args.cache_size,
+                          data_dir=args.data_dir))
+
+if __name__ == "__main__":
+    main()
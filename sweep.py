@@ -0,0 +1,220 @@
+import argparse
+import bisect
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from utils import load_network, build_csr
+from pso_algorithm import pso_csr, initialize_genes, population_fitness
+
+SWEEP_PARAMS = ("num_particles", "max_gen", "mutation_count", "crossover_rate", "lpa_fraction")
+
+# Graf dimuat sekali di proses utama lalu dikirim sekali ke tiap worker lewat initializer
+_graph = None
+
+def init_worker(indptr, indices):
+    global _graph
+    _graph = (indptr, indices)
+    # Kompilasi JIT dilakukan di sini supaya tidak ikut terhitung di waktu konfigurasi pertama
+    pso_csr(np.array([0, 1, 2]), np.array([1, 0]), 2, 1, np.random.default_rng(0))
+
+def run_rung(config, state, target_gen, until=None):
+    indptr, indices = _graph
+    state = dict(state)
+    q_scores = list(state["q_scores"])
+    times = list(state["times"])
+    offset = state["seconds"]
+    start_time = time.time()
+
+    def generation_callback(globalbest, scores, gen):
+        times.append(offset + time.time() - start_time)
+
+    options = {key: config[key] for key in ("mutation_count", "crossover_rate") if key in config}
+    population, initial_fitness = state["population"], None
+    if population is None:
+        # Populasi awal dinilai di sini supaya Q dan waktunya tercatat sebelum generasi pertama;
+        # swarm besar bisa belum menyelesaikan satu generasi pun saat konfigurasi kecil sudah selesai
+        population = initialize_genes(indptr, indices, config["num_particles"], state["rng"],
+                                      config.get("lpa_fraction", 0.0))
+        initial_fitness = population_fitness(population, indptr, indices)
+        state["initial"] = [offset + time.time() - start_time, float(initial_fitness.max())]
+
+    # Rung berikutnya melanjutkan dari personal best rung sebelumnya, bukan mulai dari nol;
+    # `until` adalah batas waktu kumulatif konfigurasi ini
+    time_limit = None if until is None else max(0.0, until - offset - (time.time() - start_time))
+    _, fitness, scores, personalbest = pso_csr(
+        indptr, indices, config["num_particles"], target_gen - len(q_scores), state["rng"],
+        initial_population=population, initial_fitness=initial_fitness,
+        generation_callback=generation_callback, time_limit=time_limit, **options
+    )
+
+    state.update(
+        population=personalbest,
+        q_scores=q_scores + scores,
+        times=times,
+        modularity=fitness,
+        seconds=offset + time.time() - start_time,
+    )
+    return state
+
+def rung_targets(max_gen, rungs, eta):
+    targets = []
+    for k in range(rungs):
+        target = max(1, round(max_gen / eta ** (rungs - 1 - k)))
+        if not targets or target > targets[-1]:
+            targets.append(target)
+    return targets
+
+def modularity_at(state, seconds):
+    # Q global best yang sudah tercapai pada detik ke-`seconds` (q_scores naik monoton);
+    # run yang sudah selesai sebelum `seconds` dinilai dengan Q terakhirnya
+    reached = bisect.bisect_right(state["times"], seconds)
+    if reached:
+        return state["q_scores"][reached - 1]
+    if state["initial"] is not None and state["initial"][0] <= seconds:
+        return state["initial"][1]
+    return float("-inf")
+
+def make_configs(grid):
+    keys = [key for key in SWEEP_PARAMS if key in grid]
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+def summarize(config, state, rung, pruned, target=None):
+    record = {
+        "config": config,
+        "modularity": float(state["modularity"]),
+        "generations": len(state["q_scores"]),
+        "seconds": state["seconds"],
+        "q_per_second": float(state["modularity"]) / state["seconds"] if state["seconds"] > 0 else None,
+        "rung": rung,
+        "pruned": pruned,
+        "q_scores": state["q_scores"],
+        "initial": state["initial"],
+        "rung_scores": state["rung_scores"],
+    }
+    if target is not None:
+        reached = [i for i, q in enumerate(state["q_scores"]) if q >= target]
+        record["seconds_to_target"] = state["times"][reached[0]] if reached else None
+    return record
+
+def successive_halving(indptr, indices, configs, rungs=3, eta=3, seed=None, workers=None,
+                       target=None, progress=None):
+    states = [
+        {"population": None, "rng": np.random.default_rng(seed), "q_scores": [], "times": [],
+         "modularity": float("-inf"), "seconds": 0.0, "rung_scores": [], "initial": None}
+        for _ in configs
+    ]
+    alive = list(range(len(configs)))
+    records = {}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(indptr, indices)) as pool:
+        def run_all(jobs):
+            futures = {i: pool.submit(run_rung, configs[i], states[i], *job) for i, job in jobs.items()}
+            for i, future in futures.items():
+                states[i] = future.result()
+
+        def unfinished(i, budget=None):
+            return (len(states[i]["q_scores"]) < configs[i]["max_gen"]
+                    and (budget is None or states[i]["seconds"] < budget))
+
+        # Tahap pertama dibatasi jumlah generasi; budget waktunya mengikuti konfigurasi paling lambat
+        run_all({i: (rung_targets(configs[i]["max_gen"], rungs, eta)[0], None) for i in alive})
+        budget = max(states[i]["seconds"] for i in alive)
+
+        for rung in range(rungs):
+            if rung == rungs - 1:
+                run_all({i: (configs[i]["max_gen"], None) for i in alive if unfinished(i)})
+                break
+
+            # Semua konfigurasi yang masih hidup diberi waktu yang sama (dibatasi max_gen-nya sendiri),
+            # lalu dibandingkan dengan Q yang sudah tercapai pada detik yang sama: max_gen ikut di-sweep
+            # dan jumlah partikel mengubah biaya per generasi, jadi Q akhir per generasi tidak sebanding
+            if rung > 0:
+                budget *= eta
+            run_all({i: (configs[i]["max_gen"], budget) for i in alive if unfinished(i, budget)})
+            scores = {i: modularity_at(states[i], budget) for i in alive}
+            for i in alive:
+                states[i]["rung_scores"] = states[i]["rung_scores"] + [[budget, scores[i]]]
+            ranked = sorted(alive, key=lambda i: scores[i], reverse=True)
+            keep = max(1, math.ceil(len(ranked) / eta))
+            for i in ranked[keep:]:
+                records[i] = summarize(configs[i], states[i], rung, True, target)
+            alive = ranked[:keep]
+            if progress:
+                progress(rung, [configs[i] for i in alive])
+
+    for i in alive:
+        records[i] = summarize(configs[i], states[i], rungs - 1, False, target)
+    return [records[i] for i in range(len(configs))]
+
+def cheapest(records):
+    reached = [record for record in records if record.get("seconds_to_target") is not None]
+    if not reached:
+        return None
+    return min(reached, key=lambda record: record["seconds_to_target"])
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Sweep hyperparameter PSO-Net pada satu graf dengan successive halving."
+    )
+    parser.add_argument("input", help="File jaringan TSV")
+    parser.add_argument("-o", "--output", help="File JSON Lines hasil (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(), help="Jumlah proses worker")
+    parser.add_argument("--particles", type=int, nargs="+", default=[10, 30, 100], help="Jumlah partikel yang dicoba")
+    parser.add_argument("--max-gen", type=int, nargs="+", default=[50, 100, 200], help="Maksimum generasi yang dicoba")
+    parser.add_argument("--mutation-count", type=int, nargs="+", default=[1], help="Jumlah gen yang dimutasi per partikel")
+    parser.add_argument("--crossover-rate", type=float, nargs="+", default=[1.0], help="Peluang crossover per partikel")
+    parser.add_argument("--lpa-fraction", type=float, nargs="+", default=[0.0], help="Porsi partikel awal dari label propagation")
+    parser.add_argument("--rungs", type=int, default=3, help="Jumlah tahap successive halving")
+    parser.add_argument("--eta", type=float, default=3, help="Faktor pemangkasan per tahap")
+    parser.add_argument("--seed", type=int, help="Seed yang sama untuk semua konfigurasi")
+    parser.add_argument("--target", type=float, help="Target modularity untuk mencari konfigurasi termurah")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    network, _ = load_network(args.input, verbose=False)
+    _, indptr, indices = build_csr(network)
+    configs = make_configs({
+        "num_particles": args.particles,
+        "max_gen": args.max_gen,
+        "mutation_count": args.mutation_count,
+        "crossover_rate": args.crossover_rate,
+        "lpa_fraction": args.lpa_fraction,
+    })
+
+    def progress(rung, survivors):
+        print(f"Tahap {rung + 1}: {len(survivors)} konfigurasi lanjut", file=sys.stderr)
+
+    start_time = time.time()
+    records = successive_halving(
+        indptr, indices, configs, args.rungs, args.eta, args.seed,
+        max(1, args.workers or 1), args.target, progress
+    )
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for record in sorted(records, key=lambda record: (record["pruned"], -record["modularity"])):
+            output.write(json.dumps(record) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"Selesai: {len(configs)} konfigurasi, {time.time() - start_time:.2f} detik", file=sys.stderr)
+    if args.target is not None:
+        best = cheapest(records)
+        if best:
+            print(f"Termurah mencapai Q ≥ {args.target}: {best['config']} "
+                  f"({best['seconds_to_target']:.2f} detik)", file=sys.stderr)
+        else:
+            print(f"Tidak ada konfigurasi yang mencapai Q ≥ {args.target}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,4 @@
-from collections import defaultdict
 from itertools import product
-import random
 import time
 import networkx as nx
 import matplotlib.pyplot as plt
@@ -11,97 +9,39 @@ import numpy as np
 import pandas as pd
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from pso_algorithm import calculate_modularity, crossover, decode_particle, initialize_population, mutate, pso_net
+import kernels
+from generators import GENERATORS
+from pso_algorithm import pso_csr, decode_genes
 # ===== FUNGSI TAMBAHAN UNTUK ANALISIS KOMPLEKSITAS =====
 
-def create_test_network(n_nodes, connection_prob=0.1):
-    network = defaultdict(set)
-    
-    # Create random connections
-    for i in range(n_nodes):
-        for j in range(i + 1, n_nodes):
-            if random.random() < connection_prob:
-                network[i].add(j)
-                network[j].add(i)
-    
-    # Ensure all nodes have at least one connection
-    for i in range(n_nodes):
-        if not network[i]:
-            # Connect to a random node
-            j = random.choice([x for x in range(n_nodes) if x != i])
-            network[i].add(j)
-            network[j].add(i)
-    
-    return network
+NODE_SIZES = [1000, 3000, 10000, 30000, 100000, 300000, 1000000]
+
+def create_test_network(n_nodes, avg_degree=10, kind="er", seed=None):
+    # Generator sparse O(n + m) yang langsung menghasilkan CSR (indptr, indices)
+    return GENERATORS[kind](n_nodes, avg_degree, seed=seed)
 
 def get_network_stats(network):
     """Get number of nodes and edges in the network"""
-    n_nodes = len(network)
-    n_edges = sum(len(neighbors) for neighbors in network.values()) // 2
-    return n_nodes, n_edges
+    indptr, indices = network
+    return len(indptr) - 1, len(indices) // 2
 
-def pso_net_timed(network, num_particles=30, max_gen=100):
+def pso_net_timed(network, num_particles=30, max_gen=100, seed=None):
+    indptr, indices = network
     start_time = time.time()
-
-    population = initialize_population(network, num_particles) 
-    clusterings = [decode_particle(p) for p in population]
-    fitness = [calculate_modularity(network, c) for c in clusterings]
-
-    personalbest = population.copy()
-    personalbest_fitness = fitness.copy()
-
-    gbest_idx = np.argmax(fitness)
-    globalbest = personalbest[gbest_idx].copy()
-    globalbest_fitness = personalbest_fitness[gbest_idx]
-
-    q_scores = []
-
-    for gen in range(max_gen):
-        for i in range(num_particles):
-            child1, child2 = crossover(population[i], personalbest[i])
-            mod1 = calculate_modularity(network, decode_particle(child1))
-            mod2 = calculate_modularity(network, decode_particle(child2))
-            temp_particle = child1 if mod1 > mod2 else child2
-
-            child1, child2 = crossover(temp_particle, globalbest)
-            mod1 = calculate_modularity(network, decode_particle(child1))
-            mod2 = calculate_modularity(network, decode_particle(child2))
-            temp_particle = child1 if mod1 > mod2 else child2
-
-            temp_particle = mutate(temp_particle, network)
-
-            decoded = decode_particle(temp_particle)
-            modularity = calculate_modularity(network, decoded)
-            population[i] = temp_particle
-            fitness[i] = modularity
-
-            if modularity > personalbest_fitness[i]:
-                personalbest[i] = temp_particle
-                personalbest_fitness[i] = modularity
-
-        best_idx = np.argmax(personalbest_fitness)
-        if personalbest_fitness[best_idx] > globalbest_fitness:
-            globalbest = personalbest[best_idx]
-            globalbest_fitness = personalbest_fitness[best_idx]
-
-        current_modularity = calculate_modularity(network, decode_particle(globalbest))
-        q_scores.append(current_modularity)
-
-    end_time = time.time()
-    execution_time = end_time - start_time
-    
-    best_communities = decode_particle(globalbest)
-    return best_communities, globalbest_fitness, q_scores, execution_time
-
-def run_complexity_analysis():
-    node_sizes = [100, 150, 200, 250, 300, 350, 400, 450, 500]
+    globalbest, globalbest_fitness, q_scores, _ = pso_csr(
+        indptr, indices, num_particles, max_gen, np.random.default_rng(seed)
+    )
+    execution_time = time.time() - start_time
+    return decode_genes(globalbest), globalbest_fitness, q_scores, execution_time
+
+def run_complexity_analysis(node_sizes=None, kind="er", avg_degree=10, runs=3):
+    node_sizes = node_sizes or NODE_SIZES
     execution_times = []
     network_stats = []
     
     # Fixed parameters (G and P constant)
     num_particles = 15  # P
     max_gen = 25       # G
-    connection_prob = 0.15
     
     print("=" * 70)
     print("ANALISIS KOMPLEKSITAS WAKTU PSO COMMUNITY DETECTION")
@@ -109,27 +49,32 @@ def run_complexity_analysis():
     print(f"Parameter tetap: P (particles) = {num_particles}, G (generations) = {max_gen}")
     print(f"Kompleksitas teoritis: O(G × P × (n + m))")
     print(f"Dengan G dan P konstan, kompleksitas = O(n + m)")
-    print(f"Connection probability = {connection_prob}")
+    print(f"Generator = {kind}, rata-rata derajat = {avg_degree}, backend kernel = {kernels.active_backend}")
     print("-" * 70)
+
+    # Pemanasan supaya kompilasi JIT tidak ikut terukur pada ukuran pertama
+    pso_net_timed(create_test_network(100, avg_degree, kind, seed=0), num_particles=2, max_gen=1)
     
     for n in node_sizes:
         print(f"Testing network dengan {n} nodes...")
         
         # Create test network
-        network = create_test_network(n, connection_prob=connection_prob)
+        start_time = time.time()
+        network = create_test_network(n, avg_degree, kind, seed=n)
         n_nodes, n_edges = get_network_stats(network)
         network_stats.append((n_nodes, n_edges))
         
-        print(f"  Network: {n_nodes} nodes, {n_edges} edges")
+        print(f"  Network: {n_nodes} nodes, {n_edges} edges (dibangun dalam {time.time() - start_time:.2f}s)")
         
         # Run algorithm multiple times and take average
         times = []
-        for run in range(3):  # Run 3 times for averaging
-            print(f"  Run {run + 1}/3...", end=" ")
+        for run in range(runs):
+            print(f"  Run {run + 1}/{runs}...", end=" ")
             _, _, _, exec_time = pso_net_timed(
                 network, 
                 num_particles=num_particles, 
-                max_gen=max_gen
+                max_gen=max_gen,
+                seed=run
             )
             times.append(exec_time)
             print(f"{exec_time:.4f}s")
@@ -185,6 +130,9 @@ def plot_complexity_comparison(node_sizes, execution_times, network_stats, G=25,
              linewidth=3, alpha=0.8)
 
     
+    # Rentang 10³-10⁶ node hanya terbaca pada skala log-log
+    plt.xscale('log')
+    plt.yscale('log')
     plt.xlabel('Jumlah Node (n)', fontsize=14)
     plt.ylabel('Waktu Eksekusi (detik)', fontsize=14)
     plt.title('Analisis Kompleksitas Waktu PSO Community Detection\nO(G × P × (n + m))', fontsize=16, pad=20)
@@ -261,12 +209,18 @@ def plot_complexity_comparison(node_sizes, execution_times, network_stats, G=25,
 
 # Run the analysis
 if __name__ == "__main__":
-    # Set random seed for reproducibility
-    random.seed(42)
-    np.random.seed(42)
-    
+    import argparse
+    parser = argparse.ArgumentParser(description="Analisis kompleksitas waktu PSO-Net pada graf sintetis sparse.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=NODE_SIZES, help="Jumlah node yang diuji")
+    parser.add_argument("--kind", choices=list(GENERATORS), default="er", help="Jenis generator graf")
+    parser.add_argument("--avg-degree", type=float, default=10, help="Rata-rata derajat")
+    parser.add_argument("--runs", type=int, default=3, help="Jumlah run per ukuran")
+    args = parser.parse_args()
+
     # Run complexity analysis
-    node_sizes, execution_times, network_stats, max_gen, num_particles = run_complexity_analysis()
+    node_sizes, execution_times, network_stats, max_gen, num_particles = run_complexity_analysis(
+        args.sizes, args.kind, args.avg_degree, args.runs
+    )
     
     # Plot the results
     plot_complexity_comparison(node_sizes, execution_times, network_stats, max_gen, num_particles)
\ No newline at end of file
@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import kernels
+from generators import planted_partition
+from pso_algorithm import pso_csr, decode_genes
+# ===== BENCHMARK KUALITAS VS WAKTU (ANYTIME) PADA GRAF DENGAN KOMUNITAS TERTANAM =====
+
+# Varian pso_csr yang dibandingkan; "backend" memilih kernel, sisanya diteruskan ke pso_csr
+DEFAULT_BACKEND = kernels.active_backend
+VARIANTS = {
+    "baseline": {},
+    "lpa": {"lpa_fraction": 0.5},
+    "memetic": {"refine_every": 5},
+    "reinit": {"adaptive": "reinit"},
+}
+if DEFAULT_BACKEND != "python":
+    VARIANTS["baseline-python"] = {"backend": "python"}
+
+def normalized_mutual_info(labels_true, labels_pred):
+    n = len(labels_true)
+    if n == 0:
+        return 1.0
+    _, a = np.unique(labels_true, return_inverse=True)
+    _, b = np.unique(labels_pred, return_inverse=True)
+    joint = np.bincount(a * (b.max() + 1) + b) / n
+    joint = joint[joint > 0]
+    pa = np.bincount(a) / n
+    pb = np.bincount(b) / n
+    entropy_a = -np.sum(pa[pa > 0] * np.log(pa[pa > 0]))
+    entropy_b = -np.sum(pb[pb > 0] * np.log(pb[pb > 0]))
+    if entropy_a + entropy_b == 0:
+        return 1.0
+    mutual = entropy_a + entropy_b + np.sum(joint * np.log(joint))
+    return float(2 * mutual / (entropy_a + entropy_b))
+
+def warm_up(backend):
+    # Kompilasi JIT tidak boleh ikut terhitung dalam budget waktu
+    kernels.use_backend(backend)
+    indptr, indices = np.array([0, 1, 2]), np.array([1, 0])
+    pso_csr(indptr, indices, 2, 1, np.random.default_rng(0))
+
+def anytime_run(indptr, indices, truth, time_budget, seed=None, **options):
+    options = dict(options)
+    warm_up(options.pop("backend", DEFAULT_BACKEND))
+    snapshots = []
+    start_time = time.perf_counter()
+
+    def generation_callback(globalbest, q_scores, gen):
+        # Hanya salin gen saat global best berubah; NMI dihitung setelah run selesai
+        improved = len(q_scores) == 1 or q_scores[-1] > q_scores[-2]
+        snapshots.append((time.perf_counter() - start_time, gen, q_scores[-1], globalbest.copy() if improved else None))
+
+    pso_csr(
+        indptr, indices, max_gen=sys.maxsize, rng=np.random.default_rng(seed), time_limit=time_budget,
+        generation_callback=generation_callback, **options
+    )
+
+    curve = []
+    nmi = 0.0
+    for seconds, gen, modularity, genes in snapshots:
+        if genes is not None:
+            nmi = normalized_mutual_info(truth, decode_genes(genes))
+        curve.append({"seconds": seconds, "generation": gen, "modularity": modularity, "nmi": nmi})
+    return curve
+
+def curve_at(curve, seconds):
+    reached = [point for point in curve if point["seconds"] <= seconds]
+    return reached[-1] if reached else None
+
+def run_benchmark(node_sizes=(1000,), mixings=(0.1, 0.3), budgets=(1, 2, 5), seeds=3,
+                  variants=None, num_particles=30, output=None):
+    variants = variants or VARIANTS
+    results = []
+    for n in node_sizes:
+        for mixing in mixings:
+            indptr, indices, truth = planted_partition(n, mixing=mixing, seed=n)
+            print(f"Graf: {n} node, {len(indices) // 2} edge, mixing = {mixing}, "
+                  f"{len(np.unique(truth))} komunitas tertanam")
+
+            for name, options in variants.items():
+                for seed in range(seeds):
+                    curve = anytime_run(indptr, indices, truth, max(budgets), seed,
+                                        num_particles=num_particles, **options)
+                    results.append({"nodes": n, "mixing": mixing, "variant": name, "seed": seed, "curve": curve})
+                    print(f"  {name:<16} seed {seed}: Q = {curve[-1]['modularity']:.4f}, "
+                          f"NMI = {curve[-1]['nmi']:.4f}, {curve[-1]['generation']} generasi")
+
+    if output:
+        with open(output, "w") as f:
+            for record in results:
+                f.write(json.dumps(record) + "\n")
+    return results
+
+def summarize(results, budgets):
+    print("\nTABEL KUALITAS PADA BUDGET WAKTU (rata-rata antar seed):")
+    print("-" * 80)
+    print(f"{'Nodes':<8} {'Mixing':<8} {'Varian':<16} {'Budget (s)':<12} {'Q':<10} {'NMI':<10}")
+    print("-" * 80)
+    groups = {}
+    for record in results:
+        groups.setdefault((record["nodes"], record["mixing"], record["variant"]), []).append(record["curve"])
+    for (n, mixing, variant), curves in groups.items():
+        for budget in budgets:
+            points = [point for point in (curve_at(curve, budget) for curve in curves) if point]
+            if not points:
+                print(f"{n:<8} {mixing:<8} {variant:<16} {budget:<12} {'-':<10} {'-':<10}")
+                continue
+            q = np.mean([point["modularity"] for point in points])
+            nmi = np.mean([point["nmi"] for point in points])
+            print(f"{n:<8} {mixing:<8} {variant:<16} {budget:<12} {q:<10.4f} {nmi:<10.4f}")
+    print("-" * 80)
+
+def plot_anytime_curves(results):
+    import matplotlib.pyplot as plt
+
+    graphs = sorted({(record["nodes"], record["mixing"]) for record in results})
+    fig, axes = plt.subplots(2, len(graphs), figsize=(6 * len(graphs), 8), squeeze=False)
+    for column, graph in enumerate(graphs):
+        for variant in dict.fromkeys(record["variant"] for record in results):
+            color = None
+            for record in results:
+                if (record["nodes"], record["mixing"]) != graph or record["variant"] != variant:
+                    continue
+                seconds = [point["seconds"] for point in record["curve"]]
+                line, = axes[0][column].step(seconds, [point["modularity"] for point in record["curve"]],
+                                             where="post", color=color, alpha=0.7,
+                                             label=variant if color is None else None)
+                color = line.get_color()
+                axes[1][column].step(seconds, [point["nmi"] for point in record["curve"]],
+                                     where="post", color=color, alpha=0.7)
+        axes[0][column].set_title(f"n = {graph[0]}, mixing = {graph[1]}")
+        axes[0][column].set_ylabel("Modularity (Q)")
+        axes[1][column].set_ylabel("NMI terhadap komunitas tertanam")
+        axes[1][column].set_xlabel("Waktu (detik)")
+        axes[0][column].legend()
+        for axis in axes[:, column]:
+            axis.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.show()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark kualitas vs waktu PSO-Net pada graf planted-partition.")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000], help="Jumlah node graf")
+    parser.add_argument("--mixing", type=float, nargs="+", default=[0.1, 0.3], help="Porsi edge antar komunitas")
+    parser.add_argument("--budget", type=float, nargs="+", default=[1, 2, 5], help="Budget waktu (detik)")
+    parser.add_argument("--seeds", type=int, default=3, help="Jumlah seed per varian")
+    parser.add_argument("--particles", type=int, default=30, help="Jumlah partikel")
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), help="Varian yang dijalankan")
+    parser.add_argument("-o", "--output", help="Simpan kurva anytime sebagai JSON Lines")
+    parser.add_argument("--no-plot", action="store_true", help="Jangan tampilkan grafik")
+    args = parser.parse_args()
+
+    variants = {name: VARIANTS[name] for name in args.variants} if args.variants else None
+    results = run_benchmark(args.nodes, args.mixing, args.budget, args.seeds, variants, args.particles, args.output)
+    summarize(results, args.budget)
+    if not args.no_plot:
+        plot_anytime_curves(results)
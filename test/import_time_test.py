@@ -0,0 +1,59 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modul yang diimpor worker / CLI; masing-masing diukur di proses Python baru
+MODULES = ["utils", "kernels", "refinement", "pso_algorithm", "multilevel", "dynamic", "batch", "service", "sweep", "ensemble", "generators", "visualization"]
+HEAVY_MODULES = ["pandas", "numba", "streamlit", "matplotlib", "networkx", "scipy"]
+IMPORT_TIME_BUDGET = float(os.environ.get("IMPORT_TIME_BUDGET", "0.5"))
+REPEATS = 3
+
+def measure_import(module):
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps([elapsed, [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    elapsed, heavy = json.loads(result.stdout.strip().splitlines()[-1])
+    return elapsed, heavy
+
+def best_import_time(module):
+    runs = [measure_import(module) for _ in range(REPEATS)]
+    return min(elapsed for elapsed, _ in runs), runs[0][1]
+
+class TestImportTime(unittest.TestCase):
+
+    def test_1_no_heavy_imports(self):
+        print("🧪 Test 1: Heavy Dependencies Are Deferred")
+
+        for module in MODULES:
+            _, heavy = measure_import(module)
+            self.assertEqual(heavy, [], f"{module} mengimpor {heavy} saat import")
+
+        print("✅ PASSED: No module pulls in heavy dependencies at import time")
+
+    def test_2_import_time_budget(self):
+        print(f"🧪 Test 2: Import Time Budget ({IMPORT_TIME_BUDGET:.2f}s)")
+
+        for module in MODULES:
+            elapsed, _ = best_import_time(module)
+            self.assertLess(elapsed, IMPORT_TIME_BUDGET, f"import {module} butuh {elapsed:.3f}s")
+
+        print("✅ PASSED: Every module imports within budget")
+
+if __name__ == "__main__":
+    print(f"{'Modul':<16} {'Waktu import (s)':<18} {'Dependensi berat'}")
+    print("-" * 60)
+    for module in MODULES:
+        elapsed, heavy = best_import_time(module)
+        status = "OK" if elapsed < IMPORT_TIME_BUDGET and not heavy else "MELEBIHI BUDGET"
+        print(f"{module:<16} {elapsed:<18.4f} {', '.join(heavy) or '-':<20} {status}")
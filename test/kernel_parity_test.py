@@ -0,0 +1,179 @@
+import unittest
+import os
+import sys
+import random
+import warnings
+import numpy as np
+from unittest import mock
+from collections import defaultdict
+
+# Import modules yang akan ditest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import kernels
+from utils import build_csr
+from pso_algorithm import (
+    initialize_genes, decode_genes, decode_particle, genes_to_particle,
+    calculate_modularity, labels_to_communities
+)
+from multilevel import split_loops, heavy_edge_matching, contract
+
+def random_network(n_nodes, n_edges, seed):
+    rng = random.Random(seed)
+    network = defaultdict(set)
+    for _ in range(n_edges):
+        a, b = rng.randrange(n_nodes), rng.randrange(n_nodes)
+        network[a].add(b)
+        network[b].add(a)
+    return network
+
+def order_free_case(block_sizes, n_leaves, seed):
+    # Blok berurutan dengan gen berantai (komunitas besar) ditambah daun yang gennya menunjuk ke node
+    # sebelumnya; semua komunitas kecil berukuran satu, sehingga urutan penggabungan tidak berpengaruh
+    rng = random.Random(seed)
+    network = defaultdict(set)
+    genes = []
+    start = 0
+    for size in block_sizes:
+        for offset in range(size):
+            node = start + offset
+            target = start + (offset + 1) % size
+            network[node].add(target)
+            network[target].add(node)
+            genes.append(target)
+        start += size
+    for node in range(start, start + n_leaves):
+        targets = rng.sample(range(node), min(node, 3))
+        for target in targets:
+            network[node].add(target)
+            network[target].add(node)
+        genes.append(targets[0])
+    # Node disisipkan berurutan, jadi posisi CSR sama dengan nomor node
+    return build_csr(network)[0], np.array(genes)
+
+def canonical_partition(communities):
+    groups = defaultdict(set)
+    for node, community in communities.items():
+        groups[community].add(node)
+    return {frozenset(group) for group in groups.values()}
+
+class TestKernelParity(unittest.TestCase):
+
+    def setUp(self):
+        """Setup graf acak dan populasi gen"""
+        self.cases = []
+        for seed in range(5):
+            network = random_network(60 + 20 * seed, 150 + 40 * seed, seed)
+            nodes, indptr, indices = build_csr(network)
+            genes = initialize_genes(indptr, indices, 8, np.random.default_rng(seed))
+            self.cases.append((network, nodes, indptr, indices, genes))
+
+    def tearDown(self):
+        kernels.use_backend(os.environ.get("PSO_KERNEL_BACKEND", "auto"))
+
+    def test_1_reference_matches_dict_implementation(self):
+        print("🧪 Test 1: Reference Kernels vs Dict Implementation")
+        kernels.use_backend("python")
+
+        # Perbedaan yang diketahui: decode_particle menggabungkan komunitas kecil dalam urutan iterasi set,
+        # kernel locus dalam urutan rantai. Pada gen acak partisinya bisa berbeda, jadi di sini hanya
+        # dicek bahwa node yang mendapat label sama
+        for network, nodes, indptr, indices, genes in self.cases:
+            for row in genes:
+                labels = decode_genes(row)
+                particle = genes_to_particle(row, nodes)
+                self.assertEqual(set(labels_to_communities(labels, nodes)), set(decode_particle(particle)))
+                self.assertAlmostEqual(
+                    kernels.modularity(indptr, indices, labels),
+                    calculate_modularity(network, labels_to_communities(labels, nodes))
+                )
+
+        # Pada kasus yang tidak bergantung urutan, partisinya harus identik
+        for seed, block_sizes in enumerate([(5,), (6, 5, 9), (12, 7, 5, 5)]):
+            nodes, row = order_free_case(block_sizes, 20, seed)
+            self.assertEqual(nodes, list(range(len(row))))
+            communities = labels_to_communities(decode_genes(row), nodes)
+            self.assertEqual(len(set(communities.values())), len(block_sizes))
+            self.assertEqual(
+                canonical_partition(communities),
+                canonical_partition(decode_particle(genes_to_particle(row, nodes)))
+            )
+
+        print("✅ PASSED: Reference kernels follow the dict implementation")
+
+    @unittest.skipUnless("numba" in kernels.BACKENDS, "Numba tidak terpasang")
+    def test_2_locus_decoding_parity(self):
+        print("🧪 Test 2: Locus Decoding Parity")
+
+        for _, _, _, _, genes in self.cases:
+            for row in genes:
+                python_labels, python_order = kernels.BACKENDS["python"][0](row)
+                numba_labels, numba_order = kernels.BACKENDS["numba"][0](row)
+                self.assertTrue(np.array_equal(python_labels, numba_labels))
+                self.assertTrue(np.array_equal(python_order, numba_order))
+
+                python_merged = kernels.BACKENDS["python"][1](row, python_labels, python_order)
+                numba_merged = kernels.BACKENDS["numba"][1](row, numba_labels, numba_order)
+                self.assertTrue(np.array_equal(python_merged, numba_merged))
+
+        print("✅ PASSED: JIT and reference decoding agree")
+
+    @unittest.skipUnless("numba" in kernels.BACKENDS, "Numba tidak terpasang")
+    def test_3_modularity_parity(self):
+        print("🧪 Test 3: Modularity Parity")
+
+        for _, _, indptr, indices, genes in self.cases:
+            graph = split_loops(indptr, indices)
+            mapping = heavy_edge_matching(*graph, np.random.default_rng(0))
+            coarse = contract(*graph, mapping)
+            for row in genes:
+                labels = kernels.BACKENDS["python"][1](row, *kernels.BACKENDS["python"][0](row))
+                self.assertAlmostEqual(
+                    kernels.BACKENDS["python"][2](indptr, indices, labels),
+                    kernels.BACKENDS["numba"][2](indptr, indices, labels)
+                )
+                coarse_labels = labels[:len(coarse[0]) - 1]
+                self.assertAlmostEqual(
+                    kernels.BACKENDS["python"][2](*coarse[:2], coarse_labels, coarse[2], coarse[3]),
+                    kernels.BACKENDS["numba"][2](*coarse[:2], coarse_labels, coarse[2], coarse[3])
+                )
+
+        print("✅ PASSED: JIT and reference modularity agree")
+
+    def test_4_backend_selection(self):
+        print("🧪 Test 4: Backend Selection")
+
+        self.assertEqual(kernels.use_backend("python"), "python")
+        self.assertEqual(kernels.active_backend, "python")
+        self.assertIn(kernels.use_backend("auto"), kernels.BACKENDS)
+        with self.assertRaises(ValueError):
+            kernels.use_backend("tidak_ada")
+
+        print("✅ PASSED: Backend can be selected at runtime")
+
+    def test_5_broken_numba_falls_back(self):
+        print("🧪 Test 5: Broken Numba Falls Back to Python")
+
+        numba_kernels = (kernels.locus_chains_numba, kernels.merge_small_numba, kernels.modularity_numba)
+        _, _, indptr, indices, genes = self.cases[0]
+        expected = kernels.BACKENDS["python"][1](genes[0], *kernels.BACKENDS["python"][0](genes[0]))
+        broken = mock.patch.object(kernels, "load_jit_kernels", side_effect=ImportError("numba rusak"))
+        with mock.patch.dict(kernels.BACKENDS, {"numba": numba_kernels}), broken, \
+                mock.patch.object(kernels, "_jit_error", None):
+            # Pilihan otomatis: run tetap selesai dengan kernel Python
+            self.assertEqual(kernels.use_backend("auto"), "numba")
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                labels = decode_genes(genes[0])
+            self.assertTrue(np.array_equal(labels, expected))
+            self.assertEqual(kernels.active_backend, "python")
+            self.assertTrue(any("numba" in str(warning.message) for warning in caught))
+
+            # Pilihan eksplisit: kegagalan tetap dilaporkan
+            kernels.use_backend("numba")
+            with self.assertRaises(RuntimeError):
+                decode_genes(genes[0])
+
+        print("✅ PASSED: Auto backend survives a broken numba install")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
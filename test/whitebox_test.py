@@ -6,14 +6,37 @@ import numpy as np
 from collections import defaultdict
 import sys
 import coverage
+from unittest import mock
 
 # Import modules yang akan ditest
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from utils import load_network
 from pso_algorithm import (
     initialize_population, decode_particle, calculate_modularity, 
-    crossover, mutate, pso_net
+    crossover, mutate, pso_net, initialize_genes, crossover_population,
+    mutate_population, decode_genes, csr_modularity, labels_to_communities,
+    label_propagation, labels_to_genes, refine_particle, pso_csr, population_diversity,
+    population_fitness
 )
+from utils import build_csr
+from refinement import local_moving
+from multilevel import split_loops, heavy_edge_matching, contract, multilevel_pso
+from dynamic import start_dynamic, apply_edge_updates
+import batch
+import json
+import inspect
+import asyncio
+import threading
+import socket
+import time
+import urllib.request
+import urllib.error
+import service
+import sweep
+from ensemble import ensemble_pso, co_assignment, node_stability
+import benchmark_kualitas
+from generators import erdos_renyi, power_law_graph, planted_partition
+from utils import csr_from_edges
 
 class TestPSOWhiteBox(unittest.TestCase):
     
@@ -237,6 +260,713 @@ class TestPSOWhiteBox(unittest.TestCase):
             print(f"❌ FAILED: {str(e)}")
             self.fail(f"File processing error handling failed: {str(e)}")
 
+    def test_10_population_initialization_seeded(self):
+        """Test Case 11: Path Coverage - Seeded CSR Population Initialization"""
+        print("🧪 Test 11: Seeded Population Initialization")
+
+        try:
+            network = defaultdict(set)
+            network[1] = {2, 3}
+            network[2] = {1, 3}
+            network[3] = {1, 2}
+            network[4] = set()
+
+            population_a = initialize_population(network, num_particles=4, seed=7)
+            population_b = initialize_population(network, num_particles=4, seed=7)
+
+            # Assertions
+            self.assertEqual(population_a, population_b)
+            for particle in population_a:
+                self.assertNotIn(4, particle)
+                self.assertEqual(len(particle), 3)
+                for node, neighbor in particle.items():
+                    self.assertIn(neighbor, network[node])
+
+            print("✅ PASSED: Seeded initialization is reproducible and skips isolated nodes")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Seeded population initialization failed: {str(e)}")
+
+    def test_11_population_operators(self):
+        """Test Case 12: Loop Coverage - Vectorized Crossover and Mutation"""
+        print("🧪 Test 12: Population Operators")
+
+        try:
+            network = defaultdict(set)
+            for a, b in [(1, 2), (2, 3), (3, 4), (4, 1), (1, 3), (5, 6)]:
+                network[a].add(b)
+                network[b].add(a)
+            network[7] = set()
+            nodes, indptr, indices = build_csr(network)
+            rng = np.random.default_rng(3)
+
+            parents1 = initialize_genes(indptr, indices, 6, rng)
+            parents2 = initialize_genes(indptr, indices, 6, rng)
+            child1, child2 = crossover_population(parents1, parents2, rng)
+
+            # Assertions
+            self.assertEqual(child1.shape, parents1.shape)
+            self.assertTrue(np.all((child1 == parents1) | (child1 == parents2)))
+            self.assertTrue(np.all(np.where(child1 == parents1, child2 == parents2, child2 == parents1)))
+
+            mutated = mutate_population(child1, indptr, indices, rng)
+            self.assertIs(mutated, child1)
+            for row in mutated:
+                for i, gene in enumerate(row):
+                    if gene < 0:
+                        self.assertEqual(nodes[i], 7)
+                    else:
+                        self.assertIn(nodes[gene], network[nodes[i]])
+
+            print("✅ PASSED: Population operators keep genes on valid links")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Population operators failed: {str(e)}")
+
+    def test_12_gene_decoding(self):
+        """Test Case 13: Path Coverage - Array Decoding and Modularity"""
+        print("🧪 Test 13: Gene Decoding")
+
+        try:
+            network = defaultdict(set)
+            for a, b in [(1, 2), (2, 3), (3, 4), (4, 5), (5, 1), (6, 1), (7, 8)]:
+                network[a].add(b)
+                network[b].add(a)
+            nodes, indptr, indices = build_csr(network)
+            index = {node: i for i, node in enumerate(nodes)}
+            particle = {1: 2, 2: 3, 3: 4, 4: 5, 5: 1, 6: 1, 7: 8, 8: 7}
+            genes = np.array([index[particle[node]] for node in nodes])
+
+            labels = decode_genes(genes)
+            communities = labels_to_communities(labels, nodes)
+            expected = decode_particle(particle)
+
+            # Assertions
+            self.assertEqual(communities[6], communities[1])
+            self.assertNotEqual(communities[7], communities[1])
+            self.assertAlmostEqual(
+                csr_modularity(indptr, indices, labels),
+                calculate_modularity(network, expected)
+            )
+
+            print("✅ PASSED: Array decoding matches particle decoding")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Gene decoding failed: {str(e)}")
+
+    def test_13_pso_seeded_run(self):
+        """Test Case 14: Path Coverage - Seeded PSO Run"""
+        print("🧪 Test 14: Seeded PSO Run")
+        temp_file = self.create_temp_file(self.test_data_valid)
+
+        try:
+            network, nodes = load_network(temp_file, verbose=False)
+
+            labels_a, best_a, q_scores_a = pso_net(network, num_particles=5, max_gen=3, seed=11)
+            labels_b, best_b, q_scores_b = pso_net(network, num_particles=5, max_gen=3, seed=11)
+
+            # Assertions
+            self.assertEqual(labels_a, labels_b)
+            self.assertEqual(q_scores_a, q_scores_b)
+            self.assertEqual(best_a, q_scores_a[-1])
+            self.assertEqual(sorted(q_scores_a), q_scores_a)
+
+            print("✅ PASSED: Seeded PSO runs are reproducible")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Seeded PSO run failed: {str(e)}")
+        finally:
+            os.unlink(temp_file)
+
+    def test_14_label_propagation_seeding(self):
+        """Test Case 15: Path Coverage - Label Propagation Seeded Population"""
+        print("🧪 Test 15: Label Propagation Seeding")
+
+        try:
+            network = defaultdict(set)
+            for offset in (0, 10):
+                for a in range(offset, offset + 6):
+                    for b in range(a + 1, offset + 6):
+                        network[a].add(b)
+                        network[b].add(a)
+            network[0].add(10)
+            network[10].add(0)
+            nodes, indptr, indices = build_csr(network)
+            rng = np.random.default_rng(5)
+
+            labels = label_propagation(indptr, indices, rng)
+            genes = labels_to_genes(indptr, indices, labels, rng)
+
+            # Node penghubung dengan satu tetangga di tiap klik: labelnya selalu seri
+            tied = defaultdict(set, {node: set(neighbors) for node, neighbors in network.items()})
+            for bridge in range(20, 28):
+                for neighbor in (1 + bridge % 5, 11 + bridge % 5):
+                    tied[bridge].add(neighbor)
+                    tied[neighbor].add(bridge)
+            _, tied_indptr, tied_indices = build_csr(tied)
+            counting = mock.Mock(wraps=np.random.default_rng(5))
+            tied_labels = label_propagation(tied_indptr, tied_indices, counting)
+            seeded = initialize_genes(indptr, indices, 4, rng, lpa_fraction=0.5)
+
+            # Assertions
+            self.assertEqual(len(set(labels.tolist())), 2)
+            # Konvergen sebelum batas 20 iterasi (dua panggilan rng.random per iterasi penuh)
+            self.assertLess(counting.random.call_count, 2 * 20)
+            for node in range(len(tied_indptr) - 1):
+                neighbor_labels = tied_labels[tied_indices[tied_indptr[node]:tied_indptr[node + 1]]]
+                self.assertEqual(np.sum(neighbor_labels == tied_labels[node]), np.bincount(neighbor_labels).max())
+            self.assertTrue(np.all(labels[genes] == labels))
+            self.assertGreater(csr_modularity(indptr, indices, decode_genes(genes)), 0.4)
+            for row in seeded:
+                for i, gene in enumerate(row):
+                    self.assertIn(nodes[gene], network[nodes[i]])
+
+            # Biaya seeding pada graf non-mainan dibatasi relatif terhadap inisialisasi seragam
+            # ditambah satu evaluasi populasi (kira-kira satu generasi)
+            big_indptr, big_indices, _ = planted_partition(20000, seed=0)
+            population_fitness(initialize_genes(big_indptr, big_indices, 2, rng), big_indptr, big_indices)
+            start = time.perf_counter()
+            uniform = initialize_genes(big_indptr, big_indices, 30, rng)
+            uniform_fitness = population_fitness(uniform, big_indptr, big_indices)
+            uniform_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            big_seeded = initialize_genes(big_indptr, big_indices, 30, rng, lpa_fraction=0.5)
+            seeded_seconds = time.perf_counter() - start
+            self.assertLess(seeded_seconds, 15 * uniform_seconds)
+            seeded_fitness = population_fitness(big_seeded[:15], big_indptr, big_indices)
+            self.assertGreater(seeded_fitness.min(), uniform_fitness.max())
+            self.assertEqual(len(np.unique(big_seeded[:15], axis=0)), 15)
+
+            print("✅ PASSED: Label propagation seeds valid locus-encoded particles")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Label propagation seeding failed: {str(e)}")
+
+    def test_15_local_move_refinement(self):
+        """Test Case 16: Loop Coverage - Memetic Local Move Refinement"""
+        print("🧪 Test 16: Local Move Refinement")
+
+        try:
+            network = defaultdict(set)
+            for offset in (0, 10):
+                for a in range(offset, offset + 6):
+                    for b in range(a + 1, offset + 6):
+                        network[a].add(b)
+                        network[b].add(a)
+            network[0].add(10)
+            network[10].add(0)
+            nodes, indptr, indices = build_csr(network)
+            rng = np.random.default_rng(2)
+
+            singletons = np.arange(len(nodes))
+            refined = local_moving(indptr, indices, singletons, rng)
+            genes = initialize_genes(indptr, indices, 1, rng)[0]
+            fitness = csr_modularity(indptr, indices, decode_genes(genes))
+            refined_genes, refined_fitness = refine_particle(indptr, indices, genes, fitness, rng)
+            _, best_refined, q_scores = pso_net(network, num_particles=4, max_gen=2, seed=1, refine_every=1)
+
+            # Assertions
+            self.assertEqual(len(set(refined.tolist())), 2)
+            self.assertGreater(
+                csr_modularity(indptr, indices, refined),
+                csr_modularity(indptr, indices, singletons)
+            )
+            self.assertGreaterEqual(refined_fitness, fitness)
+            self.assertAlmostEqual(refined_fitness, csr_modularity(indptr, indices, refined))
+            self.assertEqual(best_refined, q_scores[-1])
+
+            print("✅ PASSED: Local move refinement improves the global best")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Local move refinement failed: {str(e)}")
+
+    def test_16_multilevel_coarsening(self):
+        """Test Case 17: Path Coverage - Multilevel Coarsen, Solve and Refine"""
+        print("🧪 Test 17: Multilevel Coarsening")
+
+        try:
+            network = defaultdict(set)
+            for offset in (0, 10, 20):
+                for a in range(offset, offset + 6):
+                    for b in range(a + 1, offset + 6):
+                        network[a].add(b)
+                        network[b].add(a)
+            network[0].add(10)
+            network[10].add(0)
+            network[20].add(20)
+            nodes, indptr, indices = build_csr(network)
+            rng = np.random.default_rng(4)
+
+            graph = split_loops(indptr, indices)
+            mapping = heavy_edge_matching(*graph, rng)
+            coarse = contract(*graph, mapping)
+            coarse_labels = np.arange(len(coarse[0]) - 1) % 3
+
+            communities, modularity, q_scores = multilevel_pso(
+                network, target_size=4, num_particles=4, max_gen=2, seed=4
+            )
+
+            # Assertions
+            self.assertLess(len(coarse[0]) - 1, len(nodes))
+            self.assertAlmostEqual(coarse[2].sum() + coarse[3].sum(), float(indptr[-1]))
+            self.assertAlmostEqual(
+                csr_modularity(*coarse[:2], coarse_labels, coarse[2], coarse[3]),
+                csr_modularity(indptr, indices, coarse_labels[mapping])
+            )
+            self.assertEqual(set(communities), set(nodes))
+            self.assertAlmostEqual(modularity, calculate_modularity(network, communities))
+            self.assertEqual(len(q_scores), 2)
+
+            print("✅ PASSED: Coarsening preserves modularity and projection covers all nodes")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Multilevel coarsening failed: {str(e)}")
+
+    def test_17_dynamic_edge_updates(self):
+        """Test Case 18: Path Coverage - Warm-Started Re-detection After Edge Updates"""
+        print("🧪 Test 18: Dynamic Edge Updates")
+
+        try:
+            network = defaultdict(set)
+            for offset in (0, 10):
+                for a in range(offset, offset + 6):
+                    for b in range(a + 1, offset + 6):
+                        network[a].add(b)
+                        network[b].add(a)
+            network[0].add(10)
+            network[10].add(0)
+
+            state, _, _, _ = start_dynamic(network, num_particles=4, max_gen=2, seed=6)
+            communities, modularity, q_scores = apply_edge_updates(
+                state, added=[(5, 99), (99, 98)], removed=[(0, 10), (1, 2)], max_gen=2
+            )
+            nodes, indptr, indices = build_csr(network)
+
+            # Assertions
+            self.assertNotIn(10, network[0])
+            self.assertIn(99, communities)
+            self.assertEqual(state["nodes"], nodes)
+            self.assertTrue(np.array_equal(state["indptr"], indptr))
+            self.assertTrue(np.array_equal(state["indices"], indices))
+            for row in state["swarm"]:
+                for i, gene in enumerate(row):
+                    self.assertIn(nodes[gene], network[nodes[i]])
+            self.assertAlmostEqual(modularity, calculate_modularity(network, communities))
+            self.assertEqual(len(q_scores), 2)
+
+            # Tanpa pass PSO global: hanya local move di sekitar edge yang berubah, CSR belum disentuh
+            communities, modularity, q_scores = apply_edge_updates(
+                state, added=[(0, 10), (5, 12), (12, 99)], removed=[(99, 98)]
+            )
+            self.assertEqual(q_scores, [])
+            self.assertNotIn(98, communities)
+            self.assertAlmostEqual(modularity, calculate_modularity(network, communities))
+            self.assertTrue(np.array_equal(state["indptr"], indptr))
+            self.assertEqual(len(state["pending"]), 4)
+            self.assertEqual(communities[1], communities[2])
+
+            print("✅ PASSED: Edge updates repair the swarm and re-detect communities")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Dynamic edge updates failed: {str(e)}")
+
+    def test_18_batch_runner(self):
+        """Test Case 19: Integration - Headless Batch Runner"""
+        print("🧪 Test 19: Batch Runner")
+        valid_file = self.create_temp_file(self.test_data_valid)
+        mixed_file = self.create_temp_file(self.test_data_mixed)
+        output_file = self.create_temp_file("")
+        params_file = self.create_temp_file(json.dumps({os.path.basename(mixed_file): {"max_gen": 1}}))
+
+        try:
+            exit_code = batch.main([
+                valid_file, mixed_file, "missing_network.tsv", "-o", output_file, "-w", "2",
+                "--particles", "4", "--max-gen", "2", "--seed", "3", "--params", params_file, "--labels"
+            ])
+            with open(output_file) as f:
+                records = {record["file"]: record for record in map(json.loads, f)}
+
+            # Assertions
+            self.assertEqual(exit_code, 1)
+            self.assertEqual(len(records), 3)
+            self.assertIn("error", records["missing_network.tsv"])
+            self.assertEqual(len(records[valid_file]["q_scores"]), 2)
+            self.assertEqual(records[mixed_file]["params"]["max_gen"], 1)
+            self.assertEqual(records[mixed_file]["params"]["seed"], 4)
+            self.assertEqual(set(records[valid_file]["labels"]), {"1", "2", "3", "4"})
+            # Batch dan service memakai daftar parameter yang sama, dan semuanya diterima pso_net
+            self.assertIs(batch.PSO_PARAMS, service.PSO_PARAMS)
+            self.assertLessEqual(set(batch.PSO_PARAMS), set(inspect.signature(pso_net).parameters))
+
+            print("✅ PASSED: Batch runner writes one JSON line per file")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Batch runner failed: {str(e)}")
+        finally:
+            for path in (valid_file, mixed_file, output_file, params_file):
+                os.unlink(path)
+
+    def test_19_job_service(self):
+        """Test Case 20: Integration - Local HTTP Job Service"""
+        print("🧪 Test 20: Job Service")
+        ready = threading.Event()
+        state = {}
+
+        def on_ready(port):
+            state["port"] = port
+            ready.set()
+
+        def run_server():
+            loop = asyncio.new_event_loop()
+            state["loop"] = loop
+            state["task"] = loop.create_task(service.serve(port=0, workers=1, ready=on_ready))
+            try:
+                loop.run_until_complete(state["task"])
+            except asyncio.CancelledError:
+                pass
+            finally:
+                loop.close()
+
+        def request(method, path, payload=None):
+            data = json.dumps(payload).encode() if payload is not None else None
+            req = urllib.request.Request(f"http://127.0.0.1:{state['port']}{path}", data=data, method=method)
+            try:
+                with urllib.request.urlopen(req, timeout=30) as response:
+                    return response.status, json.loads(response.read())
+            except urllib.error.HTTPError as e:
+                return e.code, json.loads(e.read())
+
+        def request_until_eof(method, path, payload):
+            # Klien yang membaca sampai EOF tidak boleh menggantung karena socket diwarisi worker
+            data = json.dumps(payload).encode()
+            with socket.create_connection(("127.0.0.1", state["port"]), timeout=10) as conn:
+                conn.sendall(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+                response = b""
+                while chunk := conn.recv(65536):
+                    response += chunk
+            head, _, body = response.partition(b"\r\n\r\n")
+            return int(head.split()[1]), json.loads(body)
+
+        thread = threading.Thread(target=run_server, daemon=True)
+        thread.start()
+        try:
+            self.assertTrue(ready.wait(10))
+            edges = [[1, 2], [2, 3], [3, 1], [3, 4], [4, 5], [5, 6], [6, 4]]
+            params = {"num_particles": 4, "max_gen": 2, "seed": 1}
+
+            status, job = request_until_eof("POST", "/jobs", {"edges": edges, **params})
+            self.assertEqual(status, 202)
+            deadline = time.time() + 60
+            while job["status"] in ("queued", "running") and time.time() < deadline:
+                time.sleep(0.1)
+                status, job = request("GET", f"/jobs/{job['job_id']}")
+
+            # Assertions
+            self.assertEqual(job["status"], "done")
+            self.assertEqual(set(job["result"]["labels"]), {str(node) for node in range(1, 7)})
+            self.assertEqual(len(job["result"]["q_scores"]), 2)
+
+            # Urutan/arah edge berbeda tetap memakai hasil di cache
+            status, cached = request("POST", "/jobs", {"edges": [[b, a] for a, b in reversed(edges)], **params})
+            self.assertEqual(status, 200)
+            self.assertTrue(cached["cached"])
+            self.assertEqual(cached["result"]["modularity"], job["result"]["modularity"])
+
+            self.assertEqual(request("GET", "/jobs/tidak_ada")[0], 404)
+            self.assertEqual(request("POST", "/jobs", {"seed": 1})[0], 400)
+            self.assertEqual(request("POST", "/jobs", "edges")[0], 400)
+            self.assertEqual(request("POST", "/jobs", {"path": "/etc/passwd"})[0], 403)
+            self.assertEqual(request("POST", "/jobs", [[1, 2]])[0], 400)
+            self.assertEqual(request("POST", "/jobs", {"edges": "12"})[0], 400)
+            self.assertEqual(request("DELETE", f"/jobs/{job['job_id']}")[1]["status"], "done")
+            self.assertEqual(request("GET", "/health")[1]["cached_results"], 1)
+
+            with tempfile.TemporaryDirectory() as data_dir:
+                restricted = {"data_dir": os.path.realpath(data_dir)}
+                self.assertEqual(service.resolve_data_path(restricted, "graf.tsv"),
+                                 os.path.join(restricted["data_dir"], "graf.tsv"))
+                self.assertIsNone(service.resolve_data_path(restricted, "../graf.tsv"))
+                self.assertIsNone(service.resolve_data_path(restricted, "/etc/passwd"))
+                self.assertIsNone(service.resolve_data_path({"data_dir": None}, "graf.tsv"))
+
+            print("✅ PASSED: Job service queues, runs and caches jobs")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Job service failed: {str(e)}")
+        finally:
+            if "task" in state:
+                state["loop"].call_soon_threadsafe(state["task"].cancel)
+            thread.join(10)
+
+    def test_20_hyperparameter_sweep(self):
+        """Test Case 21: Integration - Successive Halving Sweep"""
+        print("🧪 Test 21: Hyperparameter Sweep")
+        network = defaultdict(set)
+        for offset in (0, 6, 12):
+            for a in range(offset, offset + 6):
+                for b in range(a + 1, offset + 6):
+                    network[a].add(b)
+                    network[b].add(a)
+        network[5].add(6); network[6].add(5)
+        network[11].add(12); network[12].add(11)
+        _, indptr, indices = build_csr(network)
+
+        try:
+            configs = sweep.make_configs({
+                "num_particles": [4, 8], "max_gen": [9], "mutation_count": [1, 2], "crossover_rate": [1.0, 0.5]
+            })
+            records = sweep.successive_halving(indptr, indices, configs, rungs=3, eta=2, seed=0, workers=2, target=0.3)
+            survivors = [record for record in records if not record["pruned"]]
+
+            # Assertions
+            self.assertEqual(len(configs), 8)
+            self.assertEqual(sweep.rung_targets(9, 3, 2), [2, 4, 9])
+            self.assertEqual(len(survivors), 2)
+            for record in survivors:
+                self.assertEqual(record["generations"], 9)
+                self.assertEqual(len(record["q_scores"]), 9)
+                self.assertTrue(all(a <= b for a, b in zip(record["q_scores"], record["q_scores"][1:])))
+                self.assertGreater(record["q_per_second"], 0)
+            self.assertEqual(sorted(record["rung"] for record in records if record["pruned"]), [0, 0, 0, 0, 1, 1])
+            # Tiap tahap membandingkan Q pada detik yang sama untuk semua konfigurasi yang masih hidup
+            for rung in (0, 1):
+                ranked = [record for record in records if len(record["rung_scores"]) > rung]
+                self.assertEqual(len({record["rung_scores"][rung][0] for record in ranked}), 1)
+                self.assertTrue(all(record["rung_scores"][rung][1] > float("-inf") for record in ranked))
+                pruned_best = max(record["rung_scores"][rung][1] for record in ranked if record["rung"] == rung)
+                kept_worst = min(record["rung_scores"][rung][1] for record in ranked if record["rung"] > rung)
+                self.assertGreaterEqual(kept_worst, pruned_best)
+            for record in survivors:
+                _, modularity = record["rung_scores"][1]
+                self.assertLessEqual(modularity, record["modularity"])
+            self.assertIsNotNone(sweep.cheapest(records))
+            for record in records:
+                self.assertLessEqual(record["initial"][1], record["q_scores"][0])
+
+            # Q populasi awal dipakai sebelum generasi pertama selesai, bukan -inf
+            state = {"initial": [0.5, 0.2], "times": [2.0, 3.0], "q_scores": [0.3, 0.4]}
+            self.assertEqual(sweep.modularity_at(state, 0.1), float("-inf"))
+            self.assertEqual(sweep.modularity_at(state, 1.0), 0.2)
+            self.assertEqual(sweep.modularity_at(state, 2.5), 0.3)
+            self.assertEqual(sweep.modularity_at(state, 9.0), 0.4)
+
+            # Swarm besar yang lebih baik pada waktu yang sama harus lolos, meski tiap generasinya
+            # jauh lebih lama daripada seluruh run swarm kecil
+            big_indptr, big_indices, _ = planted_partition(3000, seed=0)
+            small, large = sweep.successive_halving(
+                big_indptr, big_indices,
+                [{"num_particles": 2, "max_gen": 6}, {"num_particles": 40, "max_gen": 6, "lpa_fraction": 1.0}],
+                rungs=2, eta=2, seed=0, workers=2
+            )
+            self.assertTrue(small["pruned"])
+            self.assertFalse(large["pruned"])
+            self.assertEqual(large["generations"], 6)
+            self.assertGreater(large["rung_scores"][0][1], small["rung_scores"][0][1])
+
+            print("✅ PASSED: Sweep prunes configurations and reports Q per second")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Hyperparameter sweep failed: {str(e)}")
+
+    def test_21_operator_settings(self):
+        """Test Case 22: Branch Coverage - Mutation and Crossover Settings"""
+        print("🧪 Test 22: Operator Settings")
+        _, indptr, indices = build_csr({1: {2, 3}, 2: {1, 3}, 3: {1, 2, 4}, 4: {3}})
+        genes = initialize_genes(indptr, indices, 6, np.random.default_rng(0))
+
+        try:
+            no_swap = crossover_population(genes, genes[::-1], np.random.default_rng(1), rate=0.0)
+            mutated = mutate_population(genes.copy(), indptr, indices, np.random.default_rng(2), count=3)
+            default = mutate_population(genes.copy(), indptr, indices, np.random.default_rng(2))
+            explicit = mutate_population(genes.copy(), indptr, indices, np.random.default_rng(2), count=1)
+
+            # Assertions
+            self.assertTrue(np.array_equal(no_swap[0], genes))
+            self.assertTrue(np.array_equal(default, explicit))
+            for row in mutated:
+                for node, gene in enumerate(row):
+                    self.assertIn(gene, indices[indptr[node]:indptr[node + 1]])
+
+            print("✅ PASSED: Operator settings keep genes valid")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Operator settings failed: {str(e)}")
+
+    def test_22_ensemble_consensus(self):
+        """Test Case 23: Integration - Multi-Restart Ensemble Consensus"""
+        print("🧪 Test 23: Ensemble Consensus")
+        network = defaultdict(set)
+        for offset in (0, 6, 12):
+            for a in range(offset, offset + 6):
+                for b in range(a + 1, offset + 6):
+                    network[a].add(b)
+                    network[b].add(a)
+        network[5].add(6); network[6].add(5)
+        network[11].add(12); network[12].add(11)
+        network[99]
+
+        try:
+            communities, modularity, stability, run_scores = ensemble_pso(
+                network, restarts=4, seed=0, workers=2, num_particles=10, max_gen=20
+            )
+            again = ensemble_pso(network, restarts=4, seed=0, workers=2, num_particles=10, max_gen=20)
+            nodes, indptr, indices = build_csr(network)
+            agreement = co_assignment(indptr, indices, np.zeros(len(nodes), dtype=np.int64))
+
+            # Assertions
+            self.assertEqual(len(run_scores), 4)
+            self.assertEqual(again[0], communities)
+            self.assertEqual(set(communities), set(range(18)))
+            self.assertNotIn(99, communities)
+            self.assertEqual(len(agreement), len(indices))
+            self.assertAlmostEqual(modularity, calculate_modularity(network, communities))
+            self.assertGreaterEqual(modularity, max(run_scores) - 1e-9)
+            self.assertEqual(stability[99], 1.0)
+            self.assertTrue(all(0.0 <= value <= 1.0 for value in stability.values()))
+            together = node_stability(indptr, indices, agreement, np.zeros(len(nodes), dtype=np.int64))
+            apart = node_stability(indptr, indices, agreement, np.arange(len(nodes)))
+            self.assertTrue(np.all(together == 1.0))
+            self.assertTrue(np.all(apart[np.diff(indptr) > 0] == 0.0))
+
+            print("✅ PASSED: Ensemble returns a consensus partition with node stability")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Ensemble consensus failed: {str(e)}")
+
+    def test_23_adaptive_swarm(self):
+        """Test Case 24: Branch Coverage - Diversity Metrics and Adaptive Swarm"""
+        print("🧪 Test 24: Adaptive Swarm")
+        network = defaultdict(set)
+        for offset in (0, 8, 16):
+            for a in range(offset, offset + 8):
+                for b in range(a + 1, offset + 8):
+                    network[a].add(b)
+                    network[b].add(a)
+        network[7].add(8); network[8].add(7)
+        _, indptr, indices = build_csr(network)
+        genes = initialize_genes(indptr, indices, 4, np.random.default_rng(0))
+        genes[2] = genes[0]
+        genes[3] = genes[1]
+
+        try:
+            stats, distances, duplicate = population_diversity(genes, genes[1])
+            self.assertEqual(stats["duplicates"], 2)
+            self.assertEqual(stats["converged"], 2)
+            self.assertEqual(distances[1], 0.0)
+            self.assertTrue(np.array_equal(duplicate, [False, False, True, True]))
+
+            logs = {}
+            for mode in (None, "shrink", "reinit"):
+                logs[mode] = []
+                _, fitness, q_scores, personalbest = pso_csr(
+                    indptr, indices, 20, 15, np.random.default_rng(1), adaptive=mode, min_particles=5,
+                    diversity_callback=lambda stats, gen, log=logs[mode]: log.append(stats)
+                )
+
+                # Assertions
+                self.assertEqual(len(logs[mode]), 15)
+                self.assertAlmostEqual(fitness, q_scores[-1])
+                self.assertTrue(all(a <= b for a, b in zip(q_scores, q_scores[1:])))
+                self.assertEqual(len(personalbest), logs[mode][-1]["active"])
+
+            self.assertTrue(all(stats["active"] == 20 for stats in logs[None] + logs["reinit"]))
+            shrink_sizes = [stats["active"] for stats in logs["shrink"]]
+            self.assertTrue(all(a >= b >= 5 for a, b in zip(shrink_sizes, shrink_sizes[1:])))
+            self.assertTrue(all(a - b <= 2 for a, b in zip([20] + shrink_sizes, shrink_sizes)))
+            self.assertLess(shrink_sizes[-1], 20)
+            self.assertGreater(sum(stats["redundant"] for stats in logs["reinit"]), 0)
+            with self.assertRaises(ValueError):
+                pso_csr(indptr, indices, 4, 1, np.random.default_rng(0), adaptive="tidak_ada")
+
+            print("✅ PASSED: Diversity is tracked and the swarm adapts")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Adaptive swarm failed: {str(e)}")
+
+    def test_24_quality_benchmark(self):
+        """Test Case 25: Integration - Anytime Quality Benchmark"""
+        print("🧪 Test 25: Quality Benchmark")
+
+        try:
+            indptr, indices, truth = planted_partition(300, mixing=0.1, seed=0)
+            sources = np.repeat(np.arange(300), np.diff(indptr))
+            crossing = np.mean(truth[sources] != truth[indices])
+
+            start_time = time.time()
+            _, _, q_scores, _ = pso_csr(indptr, indices, 10, 10 ** 6, np.random.default_rng(0), time_limit=0.2)
+            elapsed = time.time() - start_time
+            curve = benchmark_kualitas.anytime_run(indptr, indices, truth, 0.3, seed=0, num_particles=10, lpa_fraction=0.5)
+
+            # Assertions
+            self.assertLess(crossing, 0.3)
+            self.assertAlmostEqual(benchmark_kualitas.normalized_mutual_info(truth, truth), 1.0)
+            self.assertAlmostEqual(benchmark_kualitas.normalized_mutual_info(truth, truth[::-1] * 0), 0.0)
+            self.assertLess(elapsed, 2.0)
+            self.assertLess(len(q_scores), 10 ** 6)
+            self.assertTrue(all(a["seconds"] <= b["seconds"] for a, b in zip(curve, curve[1:])))
+            self.assertTrue(all(a["modularity"] <= b["modularity"] for a, b in zip(curve, curve[1:])))
+            self.assertTrue(all(0.0 <= point["nmi"] <= 1.0 for point in curve))
+            self.assertIsNone(benchmark_kualitas.curve_at(curve, -1))
+            self.assertEqual(benchmark_kualitas.curve_at(curve, 10), curve[-1])
+
+            print("✅ PASSED: Benchmark records anytime Q and NMI curves")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Quality benchmark failed: {str(e)}")
+
+    def test_25_sparse_generators(self):
+        """Test Case 26: Branch Coverage - Sparse CSR Generators"""
+        print("🧪 Test 26: Sparse Generators")
+
+        try:
+            indptr, indices = csr_from_edges(4, [0, 1, 1, 2, 3], [1, 0, 2, 2, 0])
+            self.assertEqual(indptr.tolist(), [0, 2, 4, 5, 6])
+            self.assertEqual(indices.tolist(), [1, 3, 0, 2, 1, 0])
+
+            graphs = {
+                "er": erdos_renyi(2000, 8, seed=0),
+                "powerlaw": power_law_graph(2000, 8, seed=0),
+                "planted": planted_partition(2000, 8, seed=0)[:2],
+            }
+            for name, (indptr, indices) in graphs.items():
+                n = len(indptr) - 1
+                sources = np.repeat(np.arange(n), np.diff(indptr))
+                pairs = set(zip(sources.tolist(), indices.tolist()))
+
+                # Assertions
+                self.assertEqual(n, 2000)
+                self.assertFalse(np.any(sources == indices), name)
+                self.assertEqual(len(pairs), len(indices), name)
+                self.assertTrue(all((b, a) in pairs for a, b in pairs), name)
+                self.assertTrue(np.all((np.diff(indices) > 0) | (np.diff(sources) != 0)), name)
+                self.assertGreater(len(indices) / n, 4, name)
+                self.assertLess(len(indices) / n, 12, name)
+
+            degrees = np.diff(graphs["powerlaw"][0])
+            self.assertGreater(degrees.max(), 5 * np.diff(graphs["er"][0]).max())
+            self.assertTrue(np.array_equal(erdos_renyi(500, 4, seed=3)[1], erdos_renyi(500, 4, seed=3)[1]))
+
+            print("✅ PASSED: Generators build symmetric CSR without loops or duplicates")
+
+        except Exception as e:
+            print(f"❌ FAILED: {str(e)}")
+            self.fail(f"Sparse generators failed: {str(e)}")
+
 def run_white_box_tests():
     """Run all white box tests with coverage"""
     print("=" * 60)
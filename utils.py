@@ -1,4 +1,4 @@
-import pandas as pd
+import numpy as np
 from collections import defaultdict
 from pprint import pprint
 from collections import defaultdict
@@ -37,7 +37,89 @@ def build_adjacency_list(edges, verbose=False):
             print(f" Error while building adjacency list: {e}")
         raise
 
+def network_from_edges(edges):
+    network = defaultdict(set)
+    for node1, node2 in edges:
+        if isinstance(node1, (int, float)) and not isinstance(node1, bool):
+            node1 = int(node1)
+        if isinstance(node2, (int, float)) and not isinstance(node2, bool):
+            node2 = int(node2)
+        network[node1].add(node2)
+        network[node2].add(node1)
+    return network
+
+def build_csr(network):
+    nodes = list(network.keys())
+    index = {node: i for i, node in enumerate(nodes)}
+    degrees = np.fromiter((len(network[node]) for node in nodes), dtype=np.int64, count=len(nodes))
+
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    np.cumsum(degrees, out=indptr[1:])
+    indices = np.fromiter(
+        (index[neighbor] for node in nodes for neighbor in network[node]),
+        dtype=np.int64, count=int(indptr[-1])
+    )
+
+    # Urutkan tetangga per node agar hasil sampling tidak bergantung pada urutan set
+    rows = np.repeat(np.arange(len(nodes)), degrees)
+    indices = indices[np.lexsort((indices, rows))]
+    return nodes, indptr, indices
+
+def csr_from_edges(n, sources, targets):
+    # Self-loop dan edge ganda dibuang; kunci sumber * n + tujuan yang terurut sekaligus mengurutkan tetangga
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    keep = sources != targets
+    keys = np.concatenate([sources[keep] * n + targets[keep], targets[keep] * n + sources[keep]])
+    keys.sort()
+    # np.unique jauh lebih lambat dari sort biasa untuk puluhan juta kunci
+    keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys // n, minlength=n), out=indptr[1:])
+    return indptr, keys % n
+
+def update_csr(indptr, indices, n, added=(), removed=()):
+    # added/removed berisi pasangan indeks node; n boleh lebih besar untuk node baru.
+    # Posisi tiap edge dicari dengan binary search di barisnya, lalu array disambung sekali
+    # (salinan linear, tanpa mengurutkan ulang seluruh edge)
+    old_n = len(indptr) - 1
+    degrees = np.zeros(n, dtype=np.int64)
+    degrees[:old_n] = np.diff(indptr)
+
+    def directed(pairs):
+        return sorted({(int(a), int(b)) for pair in pairs for a, b in (pair, pair[::-1])})
+
+    positions = []
+    for a, b in directed(removed):
+        if a >= old_n:
+            continue
+        start, end = indptr[a], indptr[a + 1]
+        position = start + np.searchsorted(indices[start:end], b)
+        if position < end and indices[position] == b:
+            positions.append(position)
+            degrees[a] -= 1
+    indices = np.delete(indices, positions)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(degrees, out=indptr[1:])
+
+    positions, values = [], []
+    for a, b in directed(added):
+        start, end = indptr[a], indptr[a + 1]
+        position = start + np.searchsorted(indices[start:end], b)
+        if position < end and indices[position] == b:
+            continue
+        positions.append(position)
+        values.append(b)
+        degrees[a] += 1
+    indices = np.insert(indices, np.array(positions, dtype=np.int64), np.array(values, dtype=np.int64))
+    np.cumsum(degrees, out=indptr[1:])
+    return indptr, indices
+
 def load_network(file_path, verbose=False):
+    # pandas hanya dibutuhkan untuk membaca file; diimpor di sini agar modul lain tetap ringan
+    import pandas as pd
+
     try:
         edges = pd.read_csv(file_path, sep='\t', header=None, skiprows=1)
         
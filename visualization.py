@@ -1,17 +1,21 @@
-import streamlit as st
-import matplotlib.pyplot as plt
-import networkx as nx
-import numpy as np
-import pandas as pd
 import io
 import itertools
 import os
 
-# 🔹 Buat folder hasil jika belum ada
+# Streamlit, matplotlib, networkx, dan pandas diimpor di dalam fungsi supaya
+# mengimpor modul ini tetap murah untuk proses yang tidak menggambar apa pun
 RESULT_DIR = "hasil"
-os.makedirs(RESULT_DIR, exist_ok=True)
+
+def result_path(filename):
+    # 🔹 Buat folder hasil jika belum ada
+    os.makedirs(RESULT_DIR, exist_ok=True)
+    return os.path.join(RESULT_DIR, filename)
 
 def initialize_visualization(network):
+    import streamlit as st
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     st.subheader("Visualisasi Awal Jaringan")
     col1, col2, col3 = st.columns([1, 3, 1])
 
@@ -37,6 +41,8 @@ def initialize_visualization(network):
         """)
 
 def create_visualization_placeholders():
+    import streamlit as st
+
     col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
     with col2:
         community_plot = st.empty()
@@ -46,6 +52,10 @@ def create_visualization_placeholders():
     return community_plot, modularity_plot, density_plot
 
 def update_visualization(labels, modularity_scores, q_scores, network, gen):
+    import streamlit as st
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     if 'community_plot' not in st.session_state:
         st.session_state.community_plot, st.session_state.modularity_plot, st.session_state.density_plot = create_visualization_placeholders()
 
@@ -83,7 +93,7 @@ def update_visualization(labels, modularity_scores, q_scores, network, gen):
         st.pyplot(fig2)
         
         # ✅ Simpan grafik modularitas ke file
-        fig2.savefig(os.path.join(RESULT_DIR, f"modularitas_iterasi_{gen}.png"), bbox_inches='tight')
+        fig2.savefig(result_path(f"modularitas_iterasi_{gen}.png"), bbox_inches='tight')
         plt.close(fig2)
 
     with st.session_state.density_plot:
@@ -94,6 +104,12 @@ def update_visualization(labels, modularity_scores, q_scores, network, gen):
         """)
 
 def show_final_communities(final_labels, network):
+    import streamlit as st
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    import numpy as np
+    import pandas as pd
+
     st.subheader("🎯 Hasil Akhir Deteksi Komunitas")
 
     col1, col2, col3 = st.columns([1, 3, 1])
@@ -121,7 +137,7 @@ def show_final_communities(final_labels, network):
         st.pyplot(fig)
         
         # ✅ Simpan hasil akhir ke file
-        fig.savefig(os.path.join(RESULT_DIR, "komunitas_akhir.png"), bbox_inches='tight')
+        fig.savefig(result_path("komunitas_akhir.png"), bbox_inches='tight')
         plt.close(fig)
 
     st.subheader("🔍 Visualisasi Setiap Komunitas")
@@ -148,7 +164,7 @@ def show_final_communities(final_labels, network):
             st.pyplot(fig_c)
         
         # ✅ Simpan per komunitas ke file
-        fig_c.savefig(os.path.join(RESULT_DIR, f"komunitas_{i}.png"), bbox_inches='tight')
+        fig_c.savefig(result_path(f"komunitas_{i}.png"), bbox_inches='tight')
         plt.close(fig_c)
 
     st.subheader("📋 Preview Komunitas dalam Bentuk Tabel")